@@ -1,7 +1,7 @@
 """
 Analytics: Anomaly Detection (ML-Assisted)
 -----------------------------------------
-TF-IDF + KMeans based anomaly indication for logs.
+Hashed term vectors + MiniBatchKMeans anomaly indication for logs.
 
 IMPORTANT:
 • Advisory ONLY (no security decisions)
@@ -18,9 +18,10 @@ Used for:
 from typing import List
 import logging
 import numpy as np
+from scipy import sparse
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.cluster import MiniBatchKMeans
 
 logger = logging.getLogger("SOC.Anomaly")
 
@@ -30,8 +31,8 @@ class AnomalyDetector:
     ML-assisted anomaly detector for log payloads.
 
     Methodology:
-    - TF-IDF vectorization
-    - KMeans clustering
+    - Hashed term-frequency vectorization (stateless)
+    - MiniBatchKMeans clustering
     - Smallest cluster MAY indicate anomalies
     """
 
@@ -51,17 +52,26 @@ class AnomalyDetector:
 
         self.clusters = clusters
 
-        self.vectorizer = TfidfVectorizer(
+        # Stateless: no vocabulary / IDF fit pass per call.
+        # Power-of-two bucket count keeps the hash modulo cheap.
+        self.vectorizer = HashingVectorizer(
+            n_features=512,
+            alternate_sign=False,
+            norm="l2",
             stop_words="english",
-            max_features=500,
-            lowercase=True
+            lowercase=True,
+            dtype=np.float32      # Halves CSR payload vs float64
         )
 
         # ⚠ EXE-safe: avoid n_init="auto"
-        self.model = KMeans(
+        # Mini-batch Lloyd steps keep the 1000-log cap cheap
+        self.model = MiniBatchKMeans(
             n_clusters=self.clusters,
             random_state=42,
-            n_init=10
+            n_init=3,
+            batch_size=256,
+            max_no_improvement=10,
+            reassignment_ratio=0.01
         )
 
     # -------------------------------------------------
@@ -103,18 +113,39 @@ class AnomalyDetector:
         if len(cleaned) < self.clusters:
             return []
 
+        # Deduplicate repetitive payloads; cluster each distinct one once
+        unique_index = {}
+        inverse = np.fromiter(
+            (unique_index.setdefault(p, len(unique_index)) for p in cleaned),
+            dtype=np.intp,
+            count=len(cleaned)
+        )
+        unique_payloads = list(unique_index)
+
+        if len(unique_payloads) < self.clusters:
+            return []
+
         try:
-            # Vectorize logs
-            X = self.vectorizer.fit_transform(cleaned)
+            # Vectorize distinct logs
+            X = self.vectorizer.transform(unique_payloads)
+
+            # Stay sparse end-to-end: MiniBatchKMeans consumes CSR
+            # directly, so the matrix is never densified
+            if not sparse.issparse(X):
+                X = sparse.csr_matrix(X, dtype=np.float32)
 
-            # Cluster logs
-            labels = self.model.fit_predict(X)
+            # Cluster distinct logs (weighted by multiplicity), then
+            # broadcast labels back to every original payload
+            weights = np.bincount(inverse).astype(np.float32)
+            unique_labels = self.model.fit_predict(X, sample_weight=weights)
+            labels = unique_labels[inverse]
 
-            # Determine smallest cluster
-            unique_labels, counts = np.unique(labels, return_counts=True)
-            anomaly_cluster = unique_labels[counts.argmin()]
+            # Determine smallest non-empty cluster (O(n) bincount, no sort)
+            counts = np.bincount(labels, minlength=self.clusters)
+            counts = np.where(counts > 0, counts, np.iinfo(counts.dtype).max)
+            anomaly_cluster = int(counts.argmin())
 
-            anomaly_ratio = counts.min() / len(labels)
+            anomaly_ratio = counts[anomaly_cluster] / len(labels)
 
             # Ignore statistical noise
             if anomaly_ratio < self.MIN_ANOMALY_RATIO:
@@ -124,11 +155,7 @@ class AnomalyDetector:
                 )
                 return []
 
-            return [
-                idx
-                for idx, label in enumerate(labels)
-                if label == anomaly_cluster
-            ]
+            return np.flatnonzero(labels == anomaly_cluster).tolist()
 
         except Exception as exc:
             # SOC rule: ML must NEVER break pipeline
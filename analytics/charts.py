@@ -11,13 +11,11 @@ SOC dashboards and PDF reports.
 • SOC-style visuals
 """
 
-from typing import Dict, List
-import matplotlib
+from typing import Dict, List, Optional, Tuple
 
-# ✅ EXE / headless safe backend
-matplotlib.use("Agg")
-
-import matplotlib.pyplot as plt
+# ✅ EXE / headless safe: Figure + Agg canvas directly (no pyplot state)
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import logging
 
 logger = logging.getLogger("SOC.Charts")
@@ -36,17 +34,51 @@ SEVERITY_COLORS = {
     "Low": "#16a34a",       # green
 }
 
+# Colors aligned index-for-index with SEVERITY_ORDER
+SEVERITY_COLOR_LIST = [SEVERITY_COLORS[sev] for sev in SEVERITY_ORDER]
+
+# Standalone (headless Agg) figures: screen-grade resolution is
+# enough for panels and reports; raster work scales with DPI²
+CHART_DPI = 72
+
+
+# -------------------------------------------------
+# FIGURE SETUP
+# -------------------------------------------------
+
+def _new_axes(figsize: Tuple[float, float]):
+    """
+    Return (fig, ax) on a fresh headless Figure (no pyplot state).
+    """
+    fig = Figure(figsize=figsize, dpi=CHART_DPI)
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot(111)
+
+
+def _reset_axes(fig: Figure):
+    """
+    Cleared single Axes of a figure (created on first use).
+    """
+    if fig.axes:
+        ax = fig.axes[0]
+        ax.clear()
+    else:
+        ax = fig.add_subplot(111)
+
+    return ax
+
 
 # -------------------------------------------------
 # SEVERITY DISTRIBUTION
 # -------------------------------------------------
 
-def severity_distribution_chart(severity_counts: Dict[str, int]):
+def severity_distribution_chart(severity_counts: Dict[str, int], fig: Optional[Figure] = None):
     """
     Generate a bar chart showing threat severity distribution.
 
     Args:
         severity_counts (Dict[str, int])
+        fig (Figure, optional): redraw this figure instead of a new one
 
     Returns:
         matplotlib.figure.Figure or None
@@ -59,17 +91,20 @@ def severity_distribution_chart(severity_counts: Dict[str, int]):
     counts = []
     colors = []
 
-    for sev in SEVERITY_ORDER:
+    for sev, color in zip(SEVERITY_ORDER, SEVERITY_COLOR_LIST):
         value = severity_counts.get(sev)
         if isinstance(value, (int, float)) and value > 0:
             severities.append(sev)
             counts.append(int(value))
-            colors.append(SEVERITY_COLORS.get(sev, "#6b7280"))
+            colors.append(color)
 
     if not severities:
         return None
 
-    fig, ax = plt.subplots(figsize=(6, 4))
+    if fig is None:
+        fig, ax = _new_axes((6, 4))
+    else:
+        ax = _reset_axes(fig)
 
     ax.bar(severities, counts, color=colors)
 
@@ -87,12 +122,13 @@ def severity_distribution_chart(severity_counts: Dict[str, int]):
 # TOP OFFENDING IPS
 # -------------------------------------------------
 
-def top_offenders_chart(top_ips: List[Dict]):
+def top_offenders_chart(top_ips: List[Dict], fig: Optional[Figure] = None):
     """
     Generate a bar chart of top offending IP addresses.
 
     Args:
         top_ips (List[Dict])
+        fig (Figure, optional): redraw this figure instead of a new one
 
     Returns:
         matplotlib.figure.Figure or None
@@ -117,7 +153,10 @@ def top_offenders_chart(top_ips: List[Dict]):
     if not ips:
         return None
 
-    fig, ax = plt.subplots(figsize=(7, 4))
+    if fig is None:
+        fig, ax = _new_axes((7, 4))
+    else:
+        ax = _reset_axes(fig)
 
     ax.bar(ips, counts, color="#2563eb")
 
@@ -35,20 +35,16 @@ def severity_counts(detections: List[Dict]) -> Dict[str, int]:
     if not isinstance(detections, list):
         return {}
 
-    counter = Counter()
-
-    for d in detections:
-        if not isinstance(d, dict):
-            continue
-
-        severity = d.get("severity")
-        if not isinstance(severity, str):
-            continue
-
-        severity = severity.strip().capitalize()
-
-        if severity in VALID_SEVERITIES:
-            counter[severity] += 1
+    # Counter consumes the generator in C (no per-item += 1)
+    counter = Counter(
+        severity
+        for severity in (
+            d["severity"].strip().capitalize()
+            for d in detections
+            if isinstance(d, dict) and isinstance(d.get("severity"), str)
+        )
+        if severity in VALID_SEVERITIES
+    )
 
     return dict(counter)
 
@@ -66,22 +62,15 @@ def top_offender_ips(detections: List[Dict], limit: int = 10) -> List[Dict]:
     if not isinstance(detections, list):
         return []
 
-    counter = Counter()
-
-    for d in detections:
-        if not isinstance(d, dict):
-            continue
-
-        ip = d.get("ip")
-        if not isinstance(ip, str):
-            continue
-
-        ip = ip.strip()
-
-        if not ip or ip.upper() == "UNKNOWN":
-            continue
-
-        counter[ip] += 1
+    counter = Counter(
+        ip
+        for ip in (
+            d["ip"].strip()
+            for d in detections
+            if isinstance(d, dict) and isinstance(d.get("ip"), str)
+        )
+        if ip and ip.upper() != "UNKNOWN"
+    )
 
     return [
         {"ip": ip, "count": count}
@@ -102,20 +91,15 @@ def incident_summary(incidents: List[Dict]) -> Dict[str, int]:
     if not isinstance(incidents, list):
         return {}
 
-    counter = Counter()
-
-    for i in incidents:
-        if not isinstance(i, dict):
-            continue
-
-        incident_type = i.get("type")
-        if not isinstance(incident_type, str):
-            continue
-
-        incident_type = incident_type.strip()
-
-        if incident_type:
-            counter[incident_type] += 1
+    counter = Counter(
+        incident_type
+        for incident_type in (
+            i["type"].strip()
+            for i in incidents
+            if isinstance(i, dict) and isinstance(i.get("type"), str)
+        )
+        if incident_type
+    )
 
     return dict(counter)
 # -------------------------------------------------
@@ -14,11 +14,11 @@ NO SMTP
 NO DB LOGIC
 """
 
-import re
 import logging
 from typing import Dict
 
 from auth import user_store
+from auth.password_policy import is_password_strong
 
 logger = logging.getLogger("SOC.Auth")
 
@@ -141,14 +141,4 @@ class AuthManager:
         - Digit
         - Symbol
         """
-        if len(password) < 8:
-            return False
-
-        checks = [
-            r"[A-Z]",        # Uppercase
-            r"[a-z]",        # Lowercase
-            r"\d",           # Digit
-            r"[^\w\s]"       # Symbol
-        ]
-
-        return all(re.search(p, password) for p in checks)
+        return is_password_strong(password)
@@ -0,0 +1,75 @@
+"""
+Password Policy
+---------------
+Single source of truth for the SOC password strength rule.
+
+✔ ≥ 8 characters
+✔ Uppercase, lowercase, digit, symbol
+✔ Pure function (no DB, no GUI)
+✔ EXE-safe
+"""
+
+import re
+
+# -------------------------------------------------
+# POLICY
+# -------------------------------------------------
+
+MIN_PASSWORD_LENGTH = 8
+
+_UPPER = 0x1
+_LOWER = 0x2
+_DIGIT = 0x4
+_SYMBOL = 0x8
+
+_REQUIRED_CLASSES = {_UPPER, _LOWER, _DIGIT, _SYMBOL}
+
+
+def _ascii_class(code: int) -> int:
+    ch = chr(code)
+
+    if "A" <= ch <= "Z":
+        return _UPPER
+    if "a" <= ch <= "z":
+        return _LOWER
+    if "0" <= ch <= "9":
+        return _DIGIT
+    if ch == "_" or ch.isspace():
+        return 0
+    return _SYMBOL
+
+
+# byte → character-class bit (mirrors the regex classes below for ASCII)
+_ASCII_CLASS_TABLE = bytes(
+    _ascii_class(i) if i < 128 else 0
+    for i in range(256)
+)
+
+# Fallback for non-ASCII passwords (Unicode digits / symbols)
+_PASSWORD_PATTERNS = (
+    re.compile(r"[A-Z]"),      # uppercase
+    re.compile(r"[a-z]"),      # lowercase
+    re.compile(r"\d"),         # digit
+    re.compile(r"[^\w\s]"),    # symbol
+)
+
+
+# -------------------------------------------------
+# CHECK
+# -------------------------------------------------
+
+def is_password_strong(password: str) -> bool:
+    """
+    True if the password satisfies the SOC policy.
+
+    ASCII passwords are classified in a single C-level
+    translate pass; anything else uses the regex classes.
+    """
+    if not isinstance(password, str) or len(password) < MIN_PASSWORD_LENGTH:
+        return False
+
+    if password.isascii():
+        classes = set(password.encode("ascii").translate(_ASCII_CLASS_TABLE))
+        return classes >= _REQUIRED_CLASSES
+
+    return all(p.search(password) for p in _PASSWORD_PATTERNS)
@@ -10,11 +10,13 @@ Handles secure password reset flow.
 ✔ EXE-safe
 """
 
+import atexit
 import logging
 import smtplib
 import threading
 import time
-import re
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
@@ -25,19 +27,169 @@ from auth.user_store import (
     validate_reset_token,
     update_password
 )
+from auth.password_policy import is_password_strong
 
 from config.settings import EMAIL_CONFIG
 
 logger = logging.getLogger("SOC.PasswordReset")
 
+# -------------------------------------------------
+# EMAIL WORKERS (BOUNDED)
+# -------------------------------------------------
+# One worker: sends share the single cached SMTP session below, so
+# extra workers would only queue on its lock. Bursts wait in the queue.
+_EMAIL_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reset-email")
+atexit.register(_EMAIL_POOL.shutdown, wait=False)
+
+# -------------------------------------------------
+# SMTP SESSION (REUSED ACROSS BURSTS)
+# -------------------------------------------------
+# EMAIL_CONFIG is static — validate required keys once at import
+_MISSING_EMAIL_KEYS = tuple(
+    key
+    for key in ("SMTP_SERVER", "SMTP_PORT", "SENDER_EMAIL", "SENDER_PASSWORD")
+    if not EMAIL_CONFIG.get(key)
+)
+
+_SMTP_CLIENT = None
+_SMTP_LOCK = threading.Lock()
+_SMTP_IDLE_TIMER = None
+_SMTP_IDLE_SECONDS = 60
+
+
+def _connect_smtp() -> smtplib.SMTP:
+    server = smtplib.SMTP(
+        EMAIL_CONFIG["SMTP_SERVER"],
+        EMAIL_CONFIG["SMTP_PORT"],
+        timeout=15
+    )
+    try:
+        server.ehlo()
+
+        if EMAIL_CONFIG.get("USE_TLS", True):
+            server.starttls()
+            server.ehlo()
+
+        server.login(
+            EMAIL_CONFIG["SENDER_EMAIL"],
+            EMAIL_CONFIG["SENDER_PASSWORD"]
+        )
+    except Exception:
+        _quit_quietly(server)
+        raise
+
+    return server
+
+
+def _quit_quietly(server: smtplib.SMTP):
+    try:
+        server.quit()
+    except Exception:
+        pass
+
+
+def _get_smtp() -> smtplib.SMTP:
+    """
+    Return a live authenticated session (caller holds _SMTP_LOCK).
+
+    A warm session is probed with NOOP and replaced if the server
+    dropped it.
+    """
+    global _SMTP_CLIENT
+
+    if _SMTP_CLIENT is not None:
+        try:
+            alive = _SMTP_CLIENT.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            alive = False
+
+        if not alive:
+            _drop_smtp()
+
+    if _SMTP_CLIENT is None:
+        _SMTP_CLIENT = _connect_smtp()
+
+    return _SMTP_CLIENT
+
+
+def _drop_smtp():
+    """
+    Close and forget the cached session (caller holds _SMTP_LOCK).
+    """
+    global _SMTP_CLIENT
+
+    if _SMTP_CLIENT is not None:
+        _quit_quietly(_SMTP_CLIENT)
+        _SMTP_CLIENT = None
+
+
+def _close_smtp():
+    """
+    Close the cached session (idle timeout / shutdown).
+    """
+    with _SMTP_LOCK:
+        _drop_smtp()
+
+
+def _schedule_smtp_idle_close():
+    """
+    (Re)arm the idle timer (caller holds _SMTP_LOCK).
+    """
+    global _SMTP_IDLE_TIMER
+
+    if _SMTP_IDLE_TIMER is not None:
+        _SMTP_IDLE_TIMER.cancel()
+
+    _SMTP_IDLE_TIMER = threading.Timer(_SMTP_IDLE_SECONDS, _close_smtp)
+    _SMTP_IDLE_TIMER.daemon = True
+    _SMTP_IDLE_TIMER.start()
+
+
+atexit.register(_close_smtp)
+
 # -------------------------------------------------
 # BASIC RATE LIMIT (IN-MEMORY, SOC-SAFE)
 # -------------------------------------------------
-_RESET_REQUEST_CACHE = {}
+# identifier → (attempts, last_time), oldest last_time first
+_RESET_REQUEST_CACHE = OrderedDict()
+_RESET_CACHE_LOCK = threading.Lock()
+_RESET_CACHE_MAX_ENTRIES = 10_000
 _RESET_WINDOW_SECONDS = 300   # 5 minutes
 _RESET_MAX_ATTEMPTS = 3
 
 
+def _register_reset_attempt(identifier: str, now: float) -> bool:
+    """
+    Record a reset attempt; False if the identifier is rate-limited.
+
+    Expired entries are evicted from the front and the cache is
+    size-capped, so memory stays bounded by active identifiers.
+    """
+    with _RESET_CACHE_LOCK:
+        while _RESET_REQUEST_CACHE:
+            _, (_, oldest) = next(iter(_RESET_REQUEST_CACHE.items()))
+            if now - oldest <= _RESET_WINDOW_SECONDS:
+                break
+            _RESET_REQUEST_CACHE.popitem(last=False)
+
+        attempts, last_time = _RESET_REQUEST_CACHE.get(identifier, (0, 0))
+        in_window = now - last_time < _RESET_WINDOW_SECONDS
+
+        if in_window and attempts >= _RESET_MAX_ATTEMPTS:
+            return False
+
+        _RESET_REQUEST_CACHE[identifier] = (
+            attempts + 1 if in_window else 1,
+            now
+        )
+        _RESET_REQUEST_CACHE.move_to_end(identifier)
+
+        while len(_RESET_REQUEST_CACHE) > _RESET_CACHE_MAX_ENTRIES:
+            _RESET_REQUEST_CACHE.popitem(last=False)
+
+        return True
+
+
 class PasswordResetService:
     """
     Handles password reset workflow.
@@ -52,21 +204,13 @@ class PasswordResetService:
         identifier = identifier.strip().lower()
 
         # ---- Rate limiting (soft protection) ----
-        now = time.time()
-        attempts, last_time = _RESET_REQUEST_CACHE.get(identifier, (0, 0))
-
-        if now - last_time < _RESET_WINDOW_SECONDS and attempts >= _RESET_MAX_ATTEMPTS:
+        if not _register_reset_attempt(identifier, time.time()):
             logger.warning("Password reset rate-limited for identifier: %s", identifier)
             return {
                 "success": False,
                 "error": "Too many reset attempts. Please try again later."
             }
 
-        _RESET_REQUEST_CACHE[identifier] = (
-            attempts + 1 if now - last_time < _RESET_WINDOW_SECONDS else 1,
-            now
-        )
-
         # ---- Identify user ----
         user = (
             get_user_by_email(identifier)
@@ -88,11 +232,7 @@ class PasswordResetService:
         token = create_reset_token(username)
 
         # ---- Send email asynchronously ----
-        threading.Thread(
-            target=self._send_reset_email_safe,
-            args=(email, username, token),
-            daemon=True
-        ).start()
+        _EMAIL_POOL.submit(self._send_reset_email_safe, email, username, token)
 
         logger.info("Password reset flow triggered for user: %s", username)
 
@@ -143,9 +283,10 @@ class PasswordResetService:
         Send password reset email via SMTP.
         """
 
-        for key in ("SMTP_SERVER", "SMTP_PORT", "SENDER_EMAIL", "SENDER_PASSWORD"):
-            if not EMAIL_CONFIG.get(key):
-                raise RuntimeError(f"EMAIL_CONFIG missing required key: {key}")
+        if _MISSING_EMAIL_KEYS:
+            raise RuntimeError(
+                f"EMAIL_CONFIG missing required key: {_MISSING_EMAIL_KEYS[0]}"
+            )
 
         reset_message = f"""
 Hello {username},
@@ -168,33 +309,17 @@ If you did NOT request this reset, please ignore this email.
         msg["Subject"] = "🔐 Log SOC Platform – Password Reset"
         msg.attach(MIMEText(reset_message, "plain"))
 
-        server = None
-        try:
-            server = smtplib.SMTP(
-                EMAIL_CONFIG["SMTP_SERVER"],
-                EMAIL_CONFIG["SMTP_PORT"],
-                timeout=15
-            )
-            server.ehlo()
-
-            if EMAIL_CONFIG.get("USE_TLS", True):
-                server.starttls()
-                server.ehlo()
-
-            server.login(
-                EMAIL_CONFIG["SENDER_EMAIL"],
-                EMAIL_CONFIG["SENDER_PASSWORD"]
-            )
-
-            server.send_message(msg)
-            logger.info("Password reset email delivered to %s", email)
-
-        finally:
+        with _SMTP_LOCK:
             try:
-                if server:
-                    server.quit()
+                _get_smtp().send_message(msg)
             except Exception:
-                pass
+                # Never reuse a session in an unknown state
+                _drop_smtp()
+                raise
+            finally:
+                _schedule_smtp_idle_close()
+
+        logger.info("Password reset email delivered to %s", email)
 
     # ================= PASSWORD POLICY =================
 
@@ -202,14 +327,4 @@ If you did NOT request this reset, please ignore this email.
         """
         Enforce SOC-grade password policy.
         """
-        if len(password) < 8:
-            return False
-
-        patterns = [
-            r"[A-Z]",      # uppercase
-            r"[a-z]",      # lowercase
-            r"\d",         # digit
-            r"[^\w\s]"     # special char
-        ]
-
-        return all(re.search(p, password) for p in patterns)
+        return is_password_strong(password)
@@ -5,7 +5,7 @@ Handles secure storage and retrieval of SOC users.
 
 Responsibilities:
 - SQLite user database
-- Password hashing with salt
+- Password hashing with salt (scrypt)
 - User registration storage
 - Authentication data lookup
 - Password reset token handling
@@ -17,9 +17,12 @@ NO SOC logic
 import sqlite3
 import hashlib
 import secrets
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 
 # -------------------------------------------------
 # DATABASE LOCATION
@@ -29,17 +32,79 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DB_PATH = BASE_DIR / "data" / "users.db"
 
 
+# -------------------------------------------------
+# SHARED CONNECTION
+# -------------------------------------------------
+
+_CONN: Optional[sqlite3.Connection] = None
+_DB_LOCK = threading.RLock()
+_DB_INITIALIZED = False
+
+# Once any user exists the answer never flips back (no user deletion)
+_HAS_USERS = False
+
+
+def _get_connection() -> sqlite3.Connection:
+    """
+    Return the shared connection (opened once, WAL journaling).
+    """
+    global _CONN
+
+    if _CONN is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(
+            DB_PATH,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+        _CONN = conn
+
+    return _CONN
+
+
+@contextmanager
+def _transaction():
+    """
+    Serialized write transaction on the shared connection.
+    """
+    with _DB_LOCK:
+        conn = _get_connection()
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+
+def _fetchone(query: str, params: tuple = ()):
+    with _DB_LOCK:
+        return _get_connection().execute(query, params).fetchone()
+
+
 # -------------------------------------------------
 # DATABASE INITIALIZATION
 # -------------------------------------------------
 
 def initialize_user_db():
     """
-    Create user and reset tables if they do not exist.
+    Create user and reset tables (and lookup indexes) if they do not exist.
+
+    Runs once per process; later calls return immediately.
     """
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    global _DB_INITIALIZED
+
+    if _DB_INITIALIZED:
+        return
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _transaction() as conn:
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -56,13 +121,43 @@ def initialize_user_db():
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS password_resets (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT NOT NULL,
+                username TEXT UNIQUE NOT NULL,
                 token TEXT NOT NULL,
                 expires_at TEXT NOT NULL
             )
         """)
 
-        conn.commit()
+        # Lookup indexes (UNIQUE columns are already implicitly indexed)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_users_email
+            ON users(email)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_pw_reset_user_token
+            ON password_resets(username, token)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_pw_reset_expires
+            ON password_resets(expires_at)
+        """)
+
+        # One live token per user (enables single-statement upsert).
+        # Older databases may hold stale duplicates — keep the newest.
+        cursor.execute("""
+            DELETE FROM password_resets
+            WHERE id NOT IN (
+                SELECT MAX(id) FROM password_resets GROUP BY username
+            )
+        """)
+
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS uq_pw_reset_user
+            ON password_resets(username)
+        """)
+
+    _DB_INITIALIZED = True
 
 
 # -------------------------------------------------
@@ -73,42 +168,94 @@ def _generate_salt() -> str:
     return secrets.token_hex(16)
 
 
-def _hash_password(password: str, salt: str) -> str:
+# scrypt cost parameters (stored alongside each hash for upgrades)
+_SCRYPT_N = 2 ** 14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SCRYPT_DKLEN = 32
+_SCRYPT_PREFIX = "scrypt$"
+
+
+def _hash_password(
+    password: str,
+    salt: str,
+    n: int = _SCRYPT_N,
+    r: int = _SCRYPT_R,
+    p: int = _SCRYPT_P
+) -> str:
+    """
+    Derive a scrypt hash encoded as scrypt$n=..$r=..$p=..$<hex>.
+    """
+    digest = hashlib.scrypt(
+        password.encode("utf-8"),
+        salt=bytes.fromhex(salt),
+        n=n,
+        r=r,
+        p=p,
+        dklen=_SCRYPT_DKLEN
+    ).hex()
+    return f"{_SCRYPT_PREFIX}n={n}$r={r}$p={p}${digest}"
+
+
+def _legacy_hash_password(password: str, salt: str) -> str:
+    """
+    Single-pass SHA-256 (pre-scrypt records only).
+    """
     return hashlib.sha256((password + salt).encode("utf-8")).hexdigest()
 
 
+def _verify_password(password: str, salt: str, stored_hash: str) -> bool:
+    """
+    Constant-time check against scrypt or legacy SHA-256 hashes.
+    """
+    if not stored_hash.startswith(_SCRYPT_PREFIX):
+        input_hash = _legacy_hash_password(password, salt)
+        return secrets.compare_digest(input_hash, stored_hash)
+
+    try:
+        _, n, r, p, _ = stored_hash.split("$")
+        input_hash = _hash_password(
+            password,
+            salt,
+            n=int(n.split("=", 1)[1]),
+            r=int(r.split("=", 1)[1]),
+            p=int(p.split("=", 1)[1])
+        )
+    except ValueError:
+        return False
+
+    return secrets.compare_digest(input_hash, stored_hash)
+
+
 # -------------------------------------------------
 # USER QUERIES
 # -------------------------------------------------
 
 def user_exists() -> bool:
+    global _HAS_USERS
+
+    if _HAS_USERS:
+        return True
+
     initialize_user_db()
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM users")
-        return cursor.fetchone()[0] > 0
+    _HAS_USERS = _fetchone("SELECT 1 FROM users LIMIT 1") is not None
+    return _HAS_USERS
 
 
 def get_user_by_username(username: str):
     initialize_user_db()
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT username, email, password_hash, salt
-            FROM users WHERE username = ?
-        """, (username,))
-        return cursor.fetchone()
+    return _fetchone("""
+        SELECT username, email, password_hash, salt
+        FROM users WHERE username = ?
+    """, (username,))
 
 
 def get_user_by_email(email: str):
     initialize_user_db()
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT username, email, password_hash, salt
-            FROM users WHERE email = ?
-        """, (email,))
-        return cursor.fetchone()
+    return _fetchone("""
+        SELECT username, email, password_hash, salt
+        FROM users WHERE email = ?
+    """, (email,))
 
 
 # -------------------------------------------------
@@ -116,14 +263,15 @@ def get_user_by_email(email: str):
 # -------------------------------------------------
 
 def create_user(username: str, email: str, password: str):
+    global _HAS_USERS
+
     initialize_user_db()
 
     salt = _generate_salt()
     password_hash = _hash_password(password, salt)
 
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
+    with _transaction() as conn:
+        conn.execute("""
             INSERT INTO users (username, email, password_hash, salt, created_at)
             VALUES (?, ?, ?, ?, ?)
         """, (
@@ -133,7 +281,8 @@ def create_user(username: str, email: str, password: str):
             salt,
             datetime.utcnow().isoformat()
         ))
-        conn.commit()
+
+    _HAS_USERS = True
 
 
 # -------------------------------------------------
@@ -149,10 +298,28 @@ def verify_credentials(identifier: str, password: str) -> bool:
     if not user:
         return False
 
-    _, _, stored_hash, salt = user
-    input_hash = _hash_password(password, salt)
+    username, _, stored_hash, salt = user
 
-    return secrets.compare_digest(input_hash, stored_hash)
+    if not _verify_password(password, salt, stored_hash):
+        return False
+
+    # Transparently upgrade legacy SHA-256 records to scrypt
+    if not stored_hash.startswith(_SCRYPT_PREFIX):
+        _rehash_password(username, password, salt)
+
+    return True
+
+
+def _rehash_password(username: str, password: str, salt: str):
+    """
+    Re-store a legacy hash as scrypt (reset tokens left untouched).
+    """
+    with _transaction() as conn:
+        conn.execute("""
+            UPDATE users
+            SET password_hash = ?, salt = ?
+            WHERE username = ?
+        """, (_hash_password(password, salt), salt, username))
 
 
 # -------------------------------------------------
@@ -169,41 +336,32 @@ def create_reset_token(username: str) -> str:
     token = uuid.uuid4().hex
     expires_at = (datetime.utcnow() + timedelta(minutes=15)).isoformat()
 
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-
-        # Invalidate old tokens
-        cursor.execute(
-            "DELETE FROM password_resets WHERE username = ?",
-            (username,)
-        )
-
-        cursor.execute("""
+    with _transaction() as conn:
+        # Replaces (invalidates) any previous token in one statement
+        conn.execute("""
             INSERT INTO password_resets (username, token, expires_at)
             VALUES (?, ?, ?)
+            ON CONFLICT(username) DO UPDATE SET
+                token = excluded.token,
+                expires_at = excluded.expires_at
         """, (username, token, expires_at))
 
-        conn.commit()
-
     return token
 
 
 def validate_reset_token(username: str, token: str) -> bool:
     initialize_user_db()
 
-    with sqlite3.connect(DB_PATH) as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT expires_at FROM password_resets
-            WHERE username = ? AND token = ?
-        """, (username, token))
+    row = _fetchone("""
+        SELECT expires_at FROM password_resets
+        WHERE username = ? AND token = ?
+    """, (username, token))
 
-        row = cursor.fetchone()
-        if not row:
-            return False
+    if not row:
+        return False
 
-        expires_at = datetime.fromisoformat(row[0])
-        return datetime.utcnow() < expires_at
+    expires_at = datetime.fromisoformat(row[0])
+    return datetime.utcnow() < expires_at
 
 
 def update_password(username: str, new_password: str) -> bool:
@@ -215,7 +373,7 @@ def update_password(username: str, new_password: str) -> bool:
     salt = _generate_salt()
     password_hash = _hash_password(new_password, salt)
 
-    with sqlite3.connect(DB_PATH) as conn:
+    with _transaction() as conn:
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -232,6 +390,4 @@ def update_password(username: str, new_password: str) -> bool:
             (username,)
         )
 
-        conn.commit()
-
     return True
@@ -0,0 +1,63 @@
+"""
+Bloom Filter
+------------
+Fixed-size membership filter for long-running deduplication.
+
+• Memory fixed at construction (no set growth / rehash)
+• Keys are ints (e.g. detection "dedup_key" hashes)
+• False positives possible, false negatives never
+"""
+
+import math
+
+
+class BloomFilter:
+    """
+    Bloom filter over int keys (double hashing on the 64-bit key).
+    """
+
+    __slots__ = ("_bits", "_size", "_hashes")
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 1e-6):
+        """
+        Sized so `capacity` keys stay within `error_rate` false positives.
+        """
+        size = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+
+        self._size = size
+        self._hashes = max(1, round(size / capacity * math.log(2)))
+        self._bits = bytearray((size + 7) // 8)
+
+    def _positions(self, key: int):
+        key &= 0xFFFFFFFFFFFFFFFF
+        h1 = key & 0xFFFFFFFF
+        h2 = (key >> 32) | 1  # Odd step → distinct positions
+        size = self._size
+
+        for i in range(self._hashes):
+            yield (h1 + i * h2) % size
+
+    def __contains__(self, key: int) -> bool:
+        bits = self._bits
+        return all(
+            bits[pos >> 3] & (1 << (pos & 7))
+            for pos in self._positions(key)
+        )
+
+    def add(self, key: int) -> bool:
+        """
+        Insert key; True if it was not (probably) present before.
+        """
+        bits = self._bits
+        new = False
+
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                new = True
+
+        return new
+
+    def clear(self):
+        self._bits = bytearray(len(self._bits))
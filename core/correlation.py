@@ -10,10 +10,46 @@ attack patterns and escalate severity.
 • No response logic
 """
 
-from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Dict
 
+import numpy as np
+
+from core.event_batch import EventBatch, CRITICAL, to_micros
+
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+
+def _parse_apache_time(time_str: str) -> datetime:
+    """
+    Parse "10/Oct/2000:13:55:36 ..." by fixed offsets.
+
+    Anything off the exact layout goes through strptime instead.
+    """
+    stamp = time_str.split(" ")[0]
+
+    if (
+        len(stamp) == 20
+        and stamp[2] == "/" and stamp[6] == "/" and stamp[11] == ":"
+        and stamp[14] == ":" and stamp[17] == ":"
+        and stamp.isascii()
+        and (stamp[0:2] + stamp[7:11] + stamp[12:14]
+             + stamp[15:17] + stamp[18:20]).isdigit()
+    ):
+        try:
+            return datetime(
+                int(stamp[7:11]), _MONTHS[stamp[3:6].lower()], int(stamp[0:2]),
+                int(stamp[12:14]), int(stamp[15:17]), int(stamp[18:20])
+            )
+        except (KeyError, ValueError):
+            pass
+
+    return datetime.strptime(stamp, "%d/%b/%Y:%H:%M:%S")
+
 
 class CorrelationEngine:
     """
@@ -22,6 +58,7 @@ class CorrelationEngine:
 
     def __init__(self, time_window_minutes: int = 5):
         self.time_window = timedelta(minutes=time_window_minutes)
+        self._window_us = to_micros(self.time_window)
 
     # =================================================
     # PUBLIC INTERFACE
@@ -45,17 +82,24 @@ class CorrelationEngine:
 
         incidents: List[Dict] = []
 
-        # Group detections by source IP
-        grouped_by_ip = defaultdict(list)
-        for d in detections:
-            grouped_by_ip[d.get("ip", "UNKNOWN")].append(d)
+        # One sort by (IP, timestamp) → contiguous, time-ordered
+        # per-IP runs, then one column per field for the whole batch
+        ordered = sorted(
+            detections,
+            key=lambda d: (str(d.get("ip") or "UNKNOWN"), d.get("time") or "")
+        )
+
+        # EventBatch parses each distinct timestamp string once
+        batch = EventBatch(ordered, self._parse_time)
 
-        for ip, events in grouped_by_ip.items():
-            # Sort events by timestamp (best effort)
-            events.sort(key=lambda x: x.get("time", ""))
+        for ip, start, stop in batch.ip_slices():
+            # < 5 events and no Critical → no threshold can ever fire
+            # (the window only shrinks the run); most IPs end here
+            if stop - start < 5 and not (batch.severity[start:stop] == CRITICAL).any():
+                continue
 
-            recent_events = self._filter_time_window(events)
-            incidents.extend(self._analyze_ip(ip, recent_events))
+            recent = batch.window(start, stop, self._window_us)
+            incidents.extend(self._analyze_ip(ip, batch, recent))
 
         return incidents
 
@@ -63,31 +107,6 @@ class CorrelationEngine:
     # INTERNAL HELPERS
     # =================================================
 
-    def _filter_time_window(self, events: List[Dict]) -> List[Dict]:
-        """
-        Keep only events inside the configured correlation window.
-        """
-        if not events:
-            return []
-
-        try:
-            latest_time = self._parse_time(events[-1].get("time"))
-        except Exception:
-            return events  # Safe fallback
-
-        cutoff = latest_time - self.time_window
-
-        filtered = []
-        for e in events:
-            try:
-                event_time = self._parse_time(e.get("time"))
-                if event_time >= cutoff:
-                    filtered.append(e)
-            except Exception:
-                filtered.append(e)
-
-        return filtered
-
     def _parse_time(self, time_str: str) -> datetime:
         """
         Best-effort timestamp parsing.
@@ -96,6 +115,14 @@ class CorrelationEngine:
         if not time_str or time_str == "UNKNOWN":
             return datetime.utcnow()
 
+        # Apache timestamps ("10/Oct/...") can never be ISO — skip
+        # the failing fromisoformat() attempt
+        if time_str[2:3] == "/":
+            try:
+                return _parse_apache_time(time_str)
+            except Exception:
+                return datetime.utcnow()
+
         # Try ISO first
         try:
             return datetime.fromisoformat(time_str)
@@ -104,7 +131,7 @@ class CorrelationEngine:
 
         # Try Apache format: 10/Oct/2000:13:55:36 -0700
         try:
-            return datetime.strptime(time_str.split(" ")[0], "%d/%b/%Y:%H:%M:%S")
+            return _parse_apache_time(time_str)
         except Exception:
             return datetime.utcnow()
 
@@ -113,23 +140,40 @@ class CorrelationEngine:
     # IP-LEVEL ANALYSIS
     # =================================================
 
-    def _analyze_ip(self, ip: str, events: List[Dict]) -> List[Dict]:
+    def _analyze_ip(
+        self,
+        ip: str,
+        batch: EventBatch,
+        indices: np.ndarray
+    ) -> List[Dict]:
         """
-        Analyze correlated events for a single IP.
+        Analyze correlated events (batch rows) for a single IP.
         """
         incidents: List[Dict] = []
 
-        if not events:
+        if not len(indices):
             return incidents
 
         # -------------------------------------------------
-        # Brute Force Login Attack
+        # Column masks + IOC flags
         # -------------------------------------------------
 
-        failed_logins = [
-            e for e in events
-            if "Failed Login" in e.get("rule", "")
-        ]
+        ioc = batch.ioc[indices]
+        failed_mask = batch.failed_login[indices]
+        scanner_mask = batch.scanner[indices]
+        exploit_mask = batch.severity[indices] == CRITICAL
+
+        failed_logins = batch.take(indices[failed_mask])
+        scanner_hits = batch.take(indices[scanner_mask])
+        exploit_hits = batch.take(indices[exploit_mask])
+
+        ioc_failed = bool(ioc[failed_mask].any())
+        ioc_exploit = bool(ioc[exploit_mask].any())
+        ioc_any = bool(ioc.any())
+
+        # -------------------------------------------------
+        # Brute Force Login Attack
+        # -------------------------------------------------
 
         if len(failed_logins) >= 5:
             incidents.append({
@@ -137,7 +181,7 @@ class CorrelationEngine:
                 "type": "Brute Force Login Attack",
                 "severity": "High",
                 "count": len(failed_logins),
-                "ioc_confirmed": any(e.get("ioc_hit") for e in failed_logins),
+                "ioc_confirmed": ioc_failed,
                 "evidence": failed_logins,
             })
 
@@ -145,23 +189,13 @@ class CorrelationEngine:
         # Reconnaissance → Exploitation Chain
         # -------------------------------------------------
 
-        scanner_hits = [
-            e for e in events
-            if "Scanner" in e.get("rule", "")
-        ]
-
-        exploit_hits = [
-            e for e in events
-            if e.get("severity") == "Critical"
-        ]
-
         if scanner_hits and exploit_hits:
             incidents.append({
                 "ip": ip,
                 "type": "Reconnaissance Followed by Exploitation",
                 "severity": "Critical",
                 "count": len(scanner_hits) + len(exploit_hits),
-                "ioc_confirmed": any(e.get("ioc_hit") for e in exploit_hits),
+                "ioc_confirmed": ioc_exploit,
                 "evidence": scanner_hits + exploit_hits,
             })
 
@@ -175,7 +209,7 @@ class CorrelationEngine:
                 "type": "Repeated Critical Attack Attempts",
                 "severity": "Critical",
                 "count": len(exploit_hits),
-                "ioc_confirmed": any(e.get("ioc_hit") for e in exploit_hits),
+                "ioc_confirmed": ioc_exploit,
                 "evidence": exploit_hits,
             })
 
@@ -183,14 +217,14 @@ class CorrelationEngine:
         # High Volume Suspicious Activity
         # -------------------------------------------------
 
-        if len(events) >= 10:
+        if len(indices) >= 10:
             incidents.append({
                 "ip": ip,
                 "type": "High Volume Suspicious Activity",
                 "severity": "Medium",
-                "count": len(events),
-                "ioc_confirmed": any(e.get("ioc_hit") for e in events),
-                "evidence": events,
+                "count": len(indices),
+                "ioc_confirmed": ioc_any,
+                "evidence": batch.take(indices),
             })
 
         return incidents
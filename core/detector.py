@@ -7,14 +7,163 @@ and assigns SOC-standard severity.
 IOC-aware
 Deterministic
 Audit-safe
+
+Regex backends (best available wins):
+- hyperscan  → all rules in one SIMD multi-pattern scan
+- google-re2 → linear-time matching (no catastrophic backtracking)
+- re         → stdlib fallback (always available)
+
+hyperscan / re2 fold case and classify \w, \b, \s on ASCII only, so
+they only see ASCII payloads; anything else is matched with stdlib re
+(the reference semantics), keeping verdicts backend-independent.
 """
 
+import os
 import re
-from typing import List, Dict
+import threading
+import functools
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Iterable, Iterator, Optional
 
-from core.rules import DETECTION_RULES
+from core.rules import DETECTION_RULES, RULE_IDS
 from config.severity_map import get_severity, SEVERITY_LEVELS
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+logger = logging.getLogger("SOC.Detector")
+
+# IOC-confirmed detections are bumped one severity level
+_ESCALATION = {
+    "Low": "Medium",
+    "Medium": "High",
+    "High": "Critical",
+    "Critical": "Critical"
+}
+
+
+# stdlib \s in str patterns also matches \v and \x1c-\x1f; spelled out
+# for the accelerated backends so ASCII payloads match identically
+_ASCII_SPACE = r"[\t\n\x0b\x0c\r\x1c-\x1f ]"
+_SPACE_ESCAPE = re.compile(r"(?<!\\)((?:\\\\)*)\\s")
+
+
+def _ascii_pattern(pattern: str) -> str:
+    """
+    Rule pattern for hyperscan / re2 (re-equivalent on ASCII input).
+    """
+    return _SPACE_ESCAPE.sub(lambda m: m.group(1) + _ASCII_SPACE, pattern)
+
+
+def _compile_rule(pattern: str):
+    """
+    Compile with RE2 when available, else stdlib re.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile("(?i)" + _ascii_pattern(pattern))
+        except Exception as exc:
+            logger.debug("RE2 rejected pattern, using re: %s", exc)
+
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _entry_payload(entry: Dict) -> str:
+    payload = entry.get("normalized_request") or entry.get("message") or ""
+    return payload if isinstance(payload, str) else ""
+
+
+# -------------------------------
+# HYPERSCAN DATABASE (PER PROCESS)
+# -------------------------------
+
+_HS_RULES = None
+_HS_RULES_LOCK = threading.Lock()
+
+
+def _compile_hyperscan(rules: List[tuple]):
+    flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_UTF8
+    )
+
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[_ascii_pattern(pattern).encode("utf-8") for _, pattern in rules],
+        ids=[rule_id for rule_id, _ in rules],
+        elements=len(rules),
+        flags=[flags] * len(rules),
+    )
+    return db
+
+
+def _hyperscan_rules():
+    """
+    (database, rejected rule names), compiled once and shared by every
+    engine in the process.
+
+    All rules are compiled in one pass; only if that fails is each rule
+    probed, and the ones Hyperscan rejects (e.g. very large bounded
+    repeats) are left to regex.
+    """
+    global _HS_RULES
+
+    with _HS_RULES_LOCK:
+        if _HS_RULES is not None:
+            return _HS_RULES
+
+        rules = list(enumerate(DETECTION_RULES.values()))
+        rejected = []
+
+        try:
+            db = _compile_hyperscan(rules)
+        except Exception:
+            accepted = []
+            for rule_id, name in enumerate(DETECTION_RULES):
+                try:
+                    _compile_hyperscan([rules[rule_id]])
+                    accepted.append(rules[rule_id])
+                except Exception as exc:
+                    logger.debug("Hyperscan rejected rule '%s': %s", name, exc)
+                    rejected.append(name)
+
+            try:
+                db = _compile_hyperscan(accepted) if accepted else None
+            except Exception as exc:
+                logger.warning("Hyperscan unavailable for rules, using regex: %s", exc)
+                db = None
+
+        _HS_RULES = (db, tuple(rejected)) if db is not None else (None, ())
+        return _HS_RULES
+
+
+# -------------------------------
+# PROCESS-POOL WORKERS
+# -------------------------------
+
+# One rule-only engine per worker process (IOC stays in the parent)
+_WORKER_ENGINE = None
+
+
+def _worker_init():
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = DetectionEngine()
+
+
+def _worker_scan(payloads: List[str]) -> List[tuple]:
+    return [_WORKER_ENGINE._scan(payload) for payload in payloads]
+
 
 class DetectionEngine:
     """
@@ -28,25 +177,149 @@ class DetectionEngine:
         """
         self.ioc_engine = ioc_engine
 
+        fused = "|".join(f"(?:{pattern})" for pattern in DETECTION_RULES.values())
+
         self.compiled_rules = {
-            name: re.compile(pattern, re.IGNORECASE)
+            name: _compile_rule(pattern)
             for name, pattern in DETECTION_RULES.items()
         }
 
+        # All rules fused into one alternation: a single scan tells
+        # whether ANY rule can fire. Benign lines (the common case)
+        # skip the per-rule loop entirely.
+        self._any_rule = _compile_rule(fused)
+
+        # stdlib rules for non-ASCII payloads (same objects without RE2)
+        if RE2_AVAILABLE:
+            self._re_rules = {
+                name: re.compile(pattern, re.IGNORECASE)
+                for name, pattern in DETECTION_RULES.items()
+            }
+            self._re_any = re.compile(fused, re.IGNORECASE)
+        else:
+            self._re_rules = self.compiled_rules
+            self._re_any = self._any_rule
+
+        # Optional Hyperscan database (reports every matching rule),
+        # shared by all engines and attached on the first scan, so
+        # building an engine (e.g. in a view constructor) stays cheap
+        self._rule_names = tuple(DETECTION_RULES)
+        self._hs_pending = HYPERSCAN_AVAILABLE
+        self._hs_db = None
+        self._hs_residual_ids = ()
+        self._hs_scratch = None
+        self._hs_lock = threading.Lock()
+
+        # Per-instance LRU over payload → matched rule names.
+        # Logs repeat the same requests heavily (health checks, assets).
+        self._scan = functools.lru_cache(maxsize=8192)(
+            lambda payload: tuple(self._match_rules(payload))
+        )
+
+        # (rule, ioc_hit) → final severity, resolved once
+        self._severity_table = {
+            (name, ioc_hit): self._escalate_severity(get_severity(name), ioc_hit)
+            for name in DETECTION_RULES
+            for ioc_hit in (False, True)
+        }
+
+    # ===============================
+    # RULE BACKENDS
+    # ===============================
+
+    def _attach_hyperscan(self):
+        """
+        Bind the process-wide database, with a scratch of our own.
+        """
+        with self._hs_lock:
+            if not self._hs_pending:
+                return
+
+            db, residual = _hyperscan_rules()
+            if db is not None:
+                self._hs_residual_ids = tuple(RULE_IDS[name] for name in residual)
+                self._hs_scratch = hyperscan.Scratch(db)
+                self._hs_db = db
+
+            self._hs_pending = False
+
+    def _match_rules(self, payload: str) -> List[str]:
+        """
+        Names of all rules matching the payload, in rule order.
+        """
+        if self._hs_pending:
+            self._attach_hyperscan()
+
+        if not payload.isascii():
+            return self._search_rules(self._re_any, self._re_rules, payload)
+
+        if self._hs_db is not None:
+            # Bit i set ⇔ rule i matched (dedupe + rule order for free)
+            hits = 0
+
+            def on_match(rule_id, start, end, flags, context):
+                nonlocal hits
+                hits |= 1 << rule_id
+
+            try:
+                with self._hs_lock:
+                    self._hs_db.scan(
+                        payload.encode("ascii"),
+                        match_event_handler=on_match,
+                        scratch=self._hs_scratch
+                    )
+                for rule_id in self._hs_residual_ids:
+                    if self.compiled_rules[self._rule_names[rule_id]].search(payload):
+                        hits |= 1 << rule_id
+
+                names = self._rule_names
+                matched = []
+                while hits:
+                    low = hits & -hits
+                    matched.append(names[low.bit_length() - 1])
+                    hits ^= low
+                return matched
+            except Exception as exc:
+                logger.debug("Hyperscan scan failed, using regex: %s", exc)
+
+        return self._search_rules(self._any_rule, self.compiled_rules, payload)
+
+    @staticmethod
+    def _search_rules(any_rule, rules: Dict, payload: str) -> List[str]:
+        # Per-rule pass only when the fused scan hit (overlapping rules
+        # must each be reported, which one alternation scan cannot do)
+        if not any_rule.search(payload):
+            return []
+
+        return [
+            name
+            for name, regex in rules.items()
+            if regex.search(payload)
+        ]
+
     # ===============================
     # SINGLE ENTRY ANALYSIS
     # ===============================
 
     def analyze_entry(self, entry: Dict) -> List[Dict]:
+        return self._analyze(entry)
+
+    def _analyze(
+        self,
+        entry: Dict,
+        ioc_cache: Optional[Dict] = None,
+        scanned: Optional[Dict[str, tuple]] = None
+    ) -> List[Dict]:
+        """
+        analyze_entry() with an optional per-batch IP → IOC verdict cache
+        and optional precomputed payload → matched rules results.
+        """
         if not isinstance(entry, dict):
             return []
 
         detections = []
-        seen_rules = set()
 
-        payload = entry.get("normalized_request") or entry.get("message") or ""
-        if not isinstance(payload, str):
-            payload = ""
+        payload = _entry_payload(entry)
 
         ip = entry.get("ip", "UNKNOWN")
         timestamp = entry.get("time", "UNKNOWN")
@@ -60,35 +333,32 @@ class DetectionEngine:
         # -------------------------------
         # IOC CHECK (SAFE)
         # -------------------------------
-        ioc_hit = False
-        if self.ioc_engine and ip and ip != "UNKNOWN":
-            try:
-                ioc_hit = bool(self.ioc_engine.is_malicious(ip))
-            except Exception:
-                ioc_hit = False
+        if ioc_cache is None:
+            ioc_hit = self._check_ioc(ip)
+        else:
+            ioc_hit = ioc_cache.get(ip)
+            if ioc_hit is None:
+                ioc_hit = ioc_cache[ip] = self._check_ioc(ip)
 
         # -------------------------------
         # RULE MATCHING
         # -------------------------------
-        for rule_name, regex in self.compiled_rules.items():
-            if rule_name in seen_rules:
-                continue
-
-            if regex.search(payload):
-                seen_rules.add(rule_name)
-
-                base_severity = get_severity(rule_name)
-                severity = self._escalate_severity(base_severity, ioc_hit)
-
-                detections.append({
-                    "rule": rule_name,
-                    "severity": severity,
-                    "ip": ip,
-                    "time": timestamp,
-                    "payload": payload,
-                    "raw": raw,
-                    "ioc_hit": ioc_hit
-                })
+        # Cached scan; yields each rule at most once
+        matched = scanned[payload] if scanned is not None else self._scan(payload)
+        for rule_name in matched:
+            severity = self._severity_table[(rule_name, ioc_hit)]
+
+            detections.append({
+                "rule": rule_name,
+                "rule_id": RULE_IDS[rule_name],
+                "dedup_key": hash((severity, rule_name, ip)),
+                "severity": severity,
+                "ip": ip,
+                "time": timestamp,
+                "payload": payload,
+                "raw": raw,
+                "ioc_hit": ioc_hit
+            })
 
         # -------------------------------
         # IOC-ONLY DETECTION (STRICT)
@@ -96,6 +366,8 @@ class DetectionEngine:
         if ioc_hit and not detections:
             detections.append({
                 "rule": "Threat Intelligence Match",
+                "rule_id": None,
+                "dedup_key": hash(("Critical", "Threat Intelligence Match", ip)),
                 "severity": "Critical",
                 "ip": ip,
                 "time": timestamp,
@@ -106,6 +378,15 @@ class DetectionEngine:
 
         return detections
 
+    def _check_ioc(self, ip) -> bool:
+        if not self.ioc_engine or not ip or ip == "UNKNOWN":
+            return False
+
+        try:
+            return bool(self.ioc_engine.is_malicious(ip))
+        except Exception:
+            return False
+
     # ===============================
     # SEVERITY ESCALATION
     # ===============================
@@ -114,21 +395,69 @@ class DetectionEngine:
         if not ioc_hit or severity not in SEVERITY_LEVELS:
             return severity
 
-        escalation = {
-            "Low": "Medium",
-            "Medium": "High",
-            "High": "Critical",
-            "Critical": "Critical"
-        }
-
-        return escalation.get(severity, severity)
+        return _ESCALATION.get(severity, severity)
 
     # ===============================
     # BATCH ANALYSIS
     # ===============================
 
+    def analyze_stream(self, entries: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Yield detections one by one (memory stays flat for large imports).
+        """
+        analyze = self._analyze
+
+        # Logs repeat source IPs heavily → one IOC lookup per IP per batch
+        ioc_cache: Dict = {}
+
+        for entry in entries:
+            yield from analyze(entry, ioc_cache)
+
     def analyze_batch(self, entries: List[Dict]) -> List[Dict]:
+        return list(self.analyze_stream(entries))
+
+    def analyze_batch_parallel(
+        self,
+        entries: List[Dict],
+        workers: Optional[int] = None,
+        chunk_size: int = 2048
+    ) -> List[Dict]:
+        """
+        analyze_batch() with rule scanning spread over a process pool.
+
+        Only distinct payloads are shipped to workers; IOC lookups and
+        detection records stay in this process. Small batches (or a
+        pool failure) fall back to the serial path.
+        """
+        entries = list(entries)
+        workers = workers or os.cpu_count() or 1
+
+        payloads = list(dict.fromkeys(
+            _entry_payload(entry) for entry in entries if isinstance(entry, dict)
+        ))
+
+        if workers < 2 or len(payloads) < 2 * chunk_size:
+            return self.analyze_batch(entries)
+
+        chunks = [
+            payloads[i:i + chunk_size]
+            for i in range(0, len(payloads), chunk_size)
+        ]
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                initializer=_worker_init
+            ) as pool:
+                scanned = {}
+                for chunk, results in zip(chunks, pool.map(_worker_scan, chunks)):
+                    scanned.update(zip(chunk, results))
+        except Exception as exc:
+            logger.warning("Parallel detection unavailable, running serially: %s", exc)
+            return self.analyze_batch(entries)
+
         results = []
+        ioc_cache: Dict = {}
         for entry in entries:
-            results.extend(self.analyze_entry(entry))
+            results.extend(self._analyze(entry, ioc_cache, scanned))
         return results
@@ -0,0 +1,158 @@
+"""
+Event Batch (Columnar)
+----------------------
+Column-per-field view of a detection batch for correlation.
+
+• One NumPy array per field (struct-of-arrays)
+• Sorted by (IP, timestamp) → contiguous per-IP slices
+• Original detection dicts kept for incident evidence
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from core.rules import RULE_IDS
+
+
+# Rule-id sets resolved once from the closed rule vocabulary
+FAILED_LOGIN_IDS = frozenset(
+    rule_id for name, rule_id in RULE_IDS.items() if "Failed Login" in name
+)
+SCANNER_IDS = frozenset(
+    rule_id for name, rule_id in RULE_IDS.items() if "Scanner" in name
+)
+
+SEVERITY_CODES = {"Low": 1, "Medium": 2, "High": 3, "Critical": 4}
+CRITICAL = SEVERITY_CODES["Critical"]
+NO_RULE_ID = -1
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_micros(span: timedelta) -> int:
+    """
+    Whole microseconds in a timedelta.
+    """
+    return span // _MICROSECOND
+
+
+def _to_micros(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        return (dt - _EPOCH) // _MICROSECOND
+    return (dt - _EPOCH_UTC) // _MICROSECOND
+
+
+class EventBatch:
+    """
+    Columnar, (IP, time)-sorted detection batch.
+    """
+
+    __slots__ = (
+        "events", "ips", "times", "time_ok", "time_aware",
+        "rule_ids", "severity", "ioc", "failed_login", "scanner",
+    )
+
+    def __init__(self, events: List[Dict], parse_time: Callable[[str], datetime]):
+        """
+        events must already be sorted by (IP, time).
+        parse_time may raise — such events sort as "time unknown".
+        """
+        n = len(events)
+        self.events = events
+
+        self.ips = np.empty(n, dtype=object)
+        self.times = np.zeros(n, dtype=np.int64)
+        self.time_ok = np.zeros(n, dtype=bool)
+        self.time_aware = np.zeros(n, dtype=bool)
+        self.rule_ids = np.full(n, NO_RULE_ID, dtype=np.int16)
+        self.severity = np.zeros(n, dtype=np.int8)
+        self.ioc = np.zeros(n, dtype=bool)
+        self.failed_login = np.zeros(n, dtype=bool)
+        self.scanner = np.zeros(n, dtype=bool)
+
+        # time string → (epoch µs, tz-aware); converted once per string
+        stamps: Dict[str, tuple] = {}
+
+        for i, e in enumerate(events):
+            self.ips[i] = e.get("ip", "UNKNOWN")
+            self.ioc[i] = bool(e.get("ioc_hit"))
+            self.severity[i] = SEVERITY_CODES.get(e.get("severity"), 0)
+
+            time_str = e.get("time")
+            try:
+                stamp = stamps.get(time_str) if isinstance(time_str, str) else None
+                if stamp is None:
+                    dt = parse_time(time_str)
+                    stamp = (_to_micros(dt), dt.tzinfo is not None)
+                    # "UNKNOWN" / empty resolve to "now" → not cacheable
+                    if isinstance(time_str, str) and time_str and time_str != "UNKNOWN":
+                        stamps[time_str] = stamp
+
+                self.times[i], self.time_aware[i] = stamp
+                self.time_ok[i] = True
+            except Exception:
+                pass
+
+            rule_id = e.get("rule_id")
+            if rule_id is not None:
+                self.rule_ids[i] = rule_id
+                self.failed_login[i] = rule_id in FAILED_LOGIN_IDS
+                self.scanner[i] = rule_id in SCANNER_IDS
+            else:
+                # Events without an id (IOC-only / external) → name check
+                rule = e.get("rule", "")
+                self.failed_login[i] = "Failed Login" in rule
+                self.scanner[i] = "Scanner" in rule
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def ip_slices(self):
+        """
+        Yield (ip, start, stop) for each contiguous per-IP run.
+        """
+        n = len(self.events)
+        if not n:
+            return
+
+        bounds = np.flatnonzero(self.ips[1:] != self.ips[:-1]) + 1
+        starts = np.concatenate(([0], bounds))
+        stops = np.concatenate((bounds, [n]))
+
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            yield self.ips[start], start, stop
+
+    def window(self, start: int, stop: int, span_us: int) -> np.ndarray:
+        """
+        Indices in [start, stop) within `span_us` µs of the run's last event.
+
+        Events whose time cannot be compared with it are kept.
+        """
+        if stop <= start:
+            return np.arange(0)
+
+        last = stop - 1
+        if not self.time_ok[last]:
+            return np.arange(start, stop)  # Safe fallback
+
+        cutoff = self.times[last] - span_us
+
+        times = self.times[start:stop]
+        comparable = (
+            self.time_ok[start:stop]
+            & (self.time_aware[start:stop] == self.time_aware[last])
+        )
+        keep = ~comparable | (times >= cutoff)
+
+        return np.flatnonzero(keep) + start
+
+    def take(self, indices: np.ndarray) -> List[Dict]:
+        """
+        Original detection dicts for the given indices.
+        """
+        events = self.events
+        return [events[i] for i in indices.tolist()]
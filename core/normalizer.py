@@ -9,8 +9,9 @@ Detection-agnostic
 """
 
 import html
+import functools
 import urllib.parse
-from typing import Dict
+from typing import Dict, Iterable, List
 
 
 # =================================================
@@ -20,6 +21,9 @@ from typing import Dict
 MAX_LEN = 2000
 HALF_LEN = MAX_LEN // 2
 
+# Every non-printable ASCII code point (C0 controls + DEL) → deleted
+_ASCII_CTRL_TABLE = dict.fromkeys([*range(0x20), 0x7F])
+
 
 # =================================================
 # UTILITIES
@@ -30,6 +34,14 @@ def _strip_control_chars(text: str) -> str:
     Remove non-printable control characters
     (PDF / regex / UI safety).
     """
+    # Common case: nothing to strip (single C-level scan)
+    if text.isprintable():
+        return text
+
+    # ASCII: the control set is closed → one str.translate pass
+    if text.isascii():
+        return text.translate(_ASCII_CTRL_TABLE)
+
     return "".join(ch for ch in text if ch.isprintable())
 
 
@@ -46,6 +58,11 @@ def recursive_decode(text: str, max_depth: int = 3) -> str:
     current = text
 
     for _ in range(max_depth):
+        # Nothing left to decode: unquote_plus only acts on "%" / "+",
+        # html.unescape only on "&" (true for most benign requests)
+        if "%" not in current and "+" not in current and "&" not in current:
+            break
+
         try:
             decoded = urllib.parse.unquote_plus(current)
             decoded = html.unescape(decoded)
@@ -61,6 +78,24 @@ def recursive_decode(text: str, max_depth: int = 3) -> str:
     return current
 
 
+def _normalize_text(text: str) -> str:
+    """
+    Decode → strip control chars → lowercase → length guard.
+    """
+    decoded = _strip_control_chars(recursive_decode(text)).lower()
+
+    if len(decoded) > MAX_LEN:
+        decoded = decoded[:HALF_LEN] + "..." + decoded[-HALF_LEN:]
+
+    return decoded
+
+
+# Request lines repeat heavily in access logs (assets, health checks,
+# scanners) → each distinct request is decoded once. Raw lines embed
+# a timestamp, so they are practically unique and are not cached.
+_normalize_request = functools.lru_cache(maxsize=8192)(_normalize_text)
+
+
 # =================================================
 # MAIN NORMALIZER
 # =================================================
@@ -81,36 +116,11 @@ def normalize_log_entry(entry: Dict[str, str]) -> Dict[str, str]:
     request = entry.get("request", "") or ""
     raw = entry.get("raw", "") or ""
 
-    # -------------------------------
-    # 1️⃣ Recursive decoding
-    # -------------------------------
-    decoded_request = recursive_decode(request)
-    decoded_raw = recursive_decode(raw)
-
-    # -------------------------------
-    # 2️⃣ Strip control characters
-    # -------------------------------
-    decoded_request = _strip_control_chars(decoded_request)
-    decoded_raw = _strip_control_chars(decoded_raw)
-
-    # -------------------------------
-    # 3️⃣ Normalize case
-    # -------------------------------
-    decoded_request = decoded_request.lower()
-    decoded_raw = decoded_raw.lower()
-
-    # -------------------------------
-    # 4️⃣ Length guard (memory safe)
-    # -------------------------------
-    if len(decoded_request) > MAX_LEN:
-        decoded_request = (
-            decoded_request[:HALF_LEN] + "..." + decoded_request[-HALF_LEN:]
-        )
-
-    if len(decoded_raw) > MAX_LEN:
-        decoded_raw = (
-            decoded_raw[:HALF_LEN] + "..." + decoded_raw[-HALF_LEN:]
-        )
+    # Decode → strip control chars → lowercase → length guard
+    decoded_request = (
+        _normalize_request(request) if isinstance(request, str) else ""
+    )
+    decoded_raw = _normalize_text(raw)
 
     # -------------------------------
     # FINAL ASSIGNMENT
@@ -119,3 +129,11 @@ def normalize_log_entry(entry: Dict[str, str]) -> Dict[str, str]:
     normalized["normalized_raw"] = decoded_raw
 
     return normalized
+
+
+def normalize_batch(entries: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    normalize_log_entry() over a block of parsed entries.
+    """
+    normalize = normalize_log_entry
+    return [normalize(entry) for entry in entries]
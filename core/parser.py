@@ -13,8 +13,15 @@ IMPORTANT:
 • Output is designed for normalization & detection stages
 """
 
+import mmap
+import os
 import re
-from typing import Dict, Any
+import sys
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Callable, Iterator, List, Optional
+
+logger = logging.getLogger("SOC.Parser")
 
 
 # =================================================
@@ -33,11 +40,28 @@ APACHE_COMBINED_PATTERN = re.compile(
     re.ASCII
 )
 
+# Same pattern over raw bytes (ASCII lines skip UTF-8 decoding)
+APACHE_COMBINED_PATTERN_B = re.compile(APACHE_COMBINED_PATTERN.pattern.encode("ascii"))
+
 # Generic fallback patterns
 IP_PATTERN = re.compile(r"\d{1,3}(?:\.\d{1,3}){3}")
 TIME_PATTERN = re.compile(
     r"\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}:\d{2}"
 )
+IP_PATTERN_B = re.compile(IP_PATTERN.pattern.encode("ascii"))
+TIME_PATTERN_B = re.compile(TIME_PATTERN.pattern.encode("ascii"))
+
+# One text-mode line (universal newlines), terminator included
+_TEXT_LINE = re.compile(r"[^\r\n]*(?:\r\n?|\n)|[^\r\n]+")
+
+# Characters str.strip() removes within ASCII (bytes.strip() misses \x1c-\x1f)
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+# Below this size a process pool costs more than it saves
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+# Entries per block when parse_log_file_parallel() runs serially
+SERIAL_BLOCK_LINES = 4096
 
 
 # =================================================
@@ -59,13 +83,15 @@ def parse_log_line(line: str) -> Dict[str, Any]:
     # Attempt 1: Standard Web Server Logs
     # -------------------------------------------------
 
+    # IP / status repeat on almost every line → interned, so equal
+    # values share one object (less memory, identity-fast equality)
     match = APACHE_COMBINED_PATTERN.search(line)
     if match:
         return {
             "time": match.group("time"),
-            "ip": match.group("ip"),
+            "ip": sys.intern(match.group("ip")),
             "request": match.group("request"),
-            "status": match.group("status"),
+            "status": sys.intern(match.group("status")),
             "raw": line,
         }
 
@@ -78,9 +104,182 @@ def parse_log_line(line: str) -> Dict[str, Any]:
 
     return {
         "time": time_match.group(0) if time_match else "UNKNOWN",
-        "ip": ip_match.group(0) if ip_match else "UNKNOWN",
+        "ip": sys.intern(ip_match.group(0)) if ip_match else "UNKNOWN",
         # Hard truncation for UI + memory safety
         "request": line[:200],
         "status": "UNKNOWN",
         "raw": line,
     }
+
+
+def parse_log_bytes(line: bytes) -> Dict[str, Any]:
+    """
+    parse_log_line() for a raw (undecoded) line.
+
+    ASCII lines are matched as bytes and only the captured fields
+    are decoded; anything else is decoded and parsed as text (a line
+    that decodes to nothing gives {}, like parse_log_line("")).
+    """
+    if not line.isascii():
+        return parse_log_line(line.decode("utf-8", "ignore"))
+
+    line = line.strip(_ASCII_WHITESPACE)
+    text = line.decode("ascii")
+
+    match = APACHE_COMBINED_PATTERN_B.search(line)
+    if match:
+        return {
+            "time": match.group("time").decode("ascii"),
+            "ip": sys.intern(match.group("ip").decode("ascii")),
+            "request": match.group("request").decode("ascii"),
+            "status": sys.intern(match.group("status").decode("ascii")),
+            "raw": text,
+        }
+
+    ip_match = IP_PATTERN_B.search(line)
+    time_match = TIME_PATTERN_B.search(line)
+
+    return {
+        "time": time_match.group(0).decode("ascii") if time_match else "UNKNOWN",
+        "ip": sys.intern(ip_match.group(0).decode("ascii")) if ip_match else "UNKNOWN",
+        "request": text[:200],
+        "status": "UNKNOWN",
+        "raw": text,
+    }
+
+
+def _iter_mm(mm: mmap.mmap, start: int = 0, end: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Parse the lines of mm[start:end] (start at a line boundary).
+    """
+    end = len(mm) if end is None else end
+    mm.seek(start)
+
+    while mm.tell() < end:
+        chunk = mm.readline()
+
+        if not chunk.isascii():
+            # Text-mode order: drop invalid bytes first, then split on
+            # universal newlines (segments that decode to nothing vanish)
+            for line in _TEXT_LINE.findall(chunk.decode("utf-8", "ignore")):
+                yield parse_log_line(line)
+            continue
+
+        if b"\r" not in chunk:
+            # Common case: one "\n"-terminated line, no list needed
+            yield parse_log_bytes(
+                chunk[:-1] if chunk.endswith(b"\n") else chunk
+            )
+            continue
+
+        # Lone "\r" also ends a line in text mode
+        for line in chunk.splitlines():
+            yield parse_log_bytes(line)
+
+
+def parse_log_file(path) -> Iterator[Dict[str, Any]]:
+    """
+    Parse a log file line by line via mmap.
+
+    Yields the same entries as parse_log_line() over the file opened
+    in text mode (UTF-8, errors ignored, universal newlines).
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Empty file
+
+        with mm:
+            yield from _iter_mm(mm)
+
+
+# =================================================
+# 3. PARALLEL FILE PARSING
+# =================================================
+
+def _line_ranges(path, parts: int) -> List[tuple]:
+    """
+    Split a file into ~equal (start, end) byte ranges cut after "\n".
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        step = max(1, size // parts)
+
+        ranges = []
+        start = 0
+        while start < size:
+            cut = mm.find(b"\n", min(start + step, size) - 1)
+            end = size if cut == -1 else cut + 1
+            ranges.append((start, end))
+            start = end
+
+        return ranges
+
+
+def _parse_range(path, start: int, end: int, transform: Optional[Callable]) -> List[Dict[str, Any]]:
+    """
+    Worker: parse one byte range (optionally transformed, e.g. normalized).
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        entries = list(_iter_mm(mm, start, end))
+
+    return transform(entries) if transform else entries
+
+
+def parse_log_file_parallel(
+    path,
+    workers: Optional[int] = None,
+    transform: Optional[Callable[[List[Dict]], List[Dict]]] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Parse a large log file over a process pool.
+
+    The file is cut into newline-aligned byte ranges; each worker
+    parses (and applies `transform` to) its range. Blocks are yielded
+    in file order, so the concatenation equals parse_log_file().
+
+    Small files, single-CPU hosts and pool failures fall back to a
+    serial parse yielding blocks of SERIAL_BLOCK_LINES entries.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+
+    if workers >= 2 and size >= PARALLEL_MIN_BYTES:
+        # Several ranges per worker → the first block arrives early
+        ranges = _line_ranges(path, workers * 4)
+
+        yielded = False
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+                futures = [
+                    pool.submit(_parse_range, path, start, end, transform)
+                    for start, end in ranges
+                ]
+                try:
+                    for future in futures:
+                        yield future.result()
+                        yielded = True
+                finally:
+                    # Consumer stopped early → drop ranges not yet started
+                    for future in futures:
+                        future.cancel()
+            return
+        except Exception as exc:
+            if yielded:
+                raise  # Blocks already delivered: no silent restart
+            logger.warning("Parallel parsing unavailable, running serially: %s", exc)
+
+    block = []
+    for entry in parse_log_file(path):
+        block.append(entry)
+        if len(block) >= SERIAL_BLOCK_LINES:
+            yield transform(block) if transform else block
+            block = []
+
+    if block:
+        yield transform(block) if transform else block
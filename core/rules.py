@@ -12,10 +12,8 @@ IMPORTANT:
 • Correlation & escalation are handled elsewhere
 """
 
-from collections import OrderedDict
-
-
-DETECTION_RULES = OrderedDict({
+# Plain dict: insertion order is guaranteed (Python 3.7+)
+DETECTION_RULES = {
 
     # =====================================================
     # A03 / A1 — INJECTION (SQL, OS, TEMPLATE)
@@ -153,4 +151,9 @@ DETECTION_RULES = OrderedDict({
 
     "Unhandled Exception Exposure":
         r"\b(NullPointerException|IndexError|KeyError|ValueError)\b",
-})
+}
+
+
+# Stable integer id per rule (rule order) — detections carry it so
+# downstream stages test membership with ints, not substring scans
+RULE_IDS = {name: rule_id for rule_id, name in enumerate(DETECTION_RULES)}
@@ -12,6 +12,7 @@ Bootstraps the SOC platform safely and launches the UI.
 
 import sys
 import logging
+import multiprocessing
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
@@ -132,4 +133,7 @@ def main():
 # ENTRY POINT
 # =================================================
 if __name__ == "__main__":
+    # Frozen EXE: pool workers re-launch this binary — route them
+    # to multiprocessing instead of opening another UI
+    multiprocessing.freeze_support()
     main()
@@ -49,6 +49,19 @@ THEMES_DIR = BASE_DIR / "frontend" / "themes"
 DARK_THEME = THEMES_DIR / "dark.qss"
 LIGHT_THEME = THEMES_DIR / "light.qss"
 
+# Build-time embedded themes (tools/compile_themes.py). EXE only, so
+# source runs always pick up edits to the .qss files.
+COMPILED_THEMES: dict[Path, str] = {}
+if getattr(sys, "frozen", False):
+    try:
+        from frontend.themes._compiled import DARK_QSS, LIGHT_QSS
+        COMPILED_THEMES = {
+            DARK_THEME: sys.intern(DARK_QSS),
+            LIGHT_THEME: sys.intern(LIGHT_QSS),
+        }
+    except ImportError:
+        pass  # Not compiled → read from disk
+
 
 class MainWindow(QMainWindow):
     """
@@ -56,6 +69,9 @@ class MainWindow(QMainWindow):
     Only ONE window for entire app lifetime.
     """
 
+    # QSS path → (mtime, stylesheet text); shared across instances
+    _QSS_CACHE: dict[Path, tuple[float, str]] = {}
+
     def __init__(self):
         super().__init__()
 
@@ -71,6 +87,7 @@ class MainWindow(QMainWindow):
         self.auth = AuthManager()
         self.current_user: dict | None = None
         self.current_theme: str = "dark"
+        self._last_qss: str | None = None
 
         # ------------------------------
         # Central stack
@@ -96,6 +113,7 @@ class MainWindow(QMainWindow):
         # ------------------------------
         # Theme
         # ------------------------------
+        self._preload_themes()
         self._apply_theme(self.current_theme)
 
         # ------------------------------
@@ -127,7 +145,10 @@ class MainWindow(QMainWindow):
         """
         self.current_user = user
 
-        if self.dashboard_view is None:
+        if self.dashboard_view is not None:
+            # Kept alive across logout; only the user changes
+            self.dashboard_view.set_user(user)
+        else:
             self.dashboard_view = DashboardView(user=user, parent=self)
             self.stack.addWidget(self.dashboard_view)
 
@@ -159,10 +180,9 @@ class MainWindow(QMainWindow):
     def logout(self):
         self.current_user = None
 
+        # Keep the dashboard widget tree; only per-user state is reset
         if self.dashboard_view:
-            self.stack.removeWidget(self.dashboard_view)
-            self.dashboard_view.deleteLater()
-            self.dashboard_view = None
+            self.dashboard_view.reset_for_logout()
 
         self._show_login()
 
@@ -177,11 +197,49 @@ class MainWindow(QMainWindow):
     def _apply_theme(self, theme: str):
         qss_file = DARK_THEME if theme == "dark" else LIGHT_THEME
 
-        if not qss_file.exists():
+        stylesheet = self._load_qss(qss_file)
+        if stylesheet is None:
             return  # Silent fail (SOC UX)
 
-        with open(qss_file, "r", encoding="utf-8") as f:
-            self.setStyleSheet(f.read())
+        # Same cached text object → already applied (Qt would re-parse it)
+        if stylesheet is self._last_qss:
+            return
+
+        self.setStyleSheet(stylesheet)
+        self._last_qss = stylesheet
+
+    def _preload_themes(self):
+        """
+        Read both themes once so toggling never touches disk.
+        """
+        for qss_file in (DARK_THEME, LIGHT_THEME):
+            self._load_qss(qss_file)
+
+    @classmethod
+    def _load_qss(cls, qss_file: Path) -> str | None:
+        """
+        Stylesheet text, re-read only when the file's mtime changes.
+        """
+        compiled = COMPILED_THEMES.get(qss_file)
+        if compiled is not None:
+            return compiled
+
+        try:
+            mtime = qss_file.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        cached = cls._QSS_CACHE.get(qss_file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            text = sys.intern(qss_file.read_text(encoding="utf-8", errors="replace"))
+        except OSError:
+            return None
+
+        cls._QSS_CACHE[qss_file] = (mtime, text)
+        return text
 
     # ==================================================
     # WINDOW EVENTS
@@ -14,11 +14,32 @@ SOC-GRADE • EXE-SAFE • DETERMINISTIC
 """
 
 from PySide6.QtWidgets import QWidget, QStackedWidget
-from typing import Dict, Type, Optional
-import inspect
+from typing import Callable, Dict, List, Type, Optional
 import logging
 
 
+_CO_VARARGS = 0x04
+
+# view class → constructor accepts a parent argument
+_TAKES_PARENT: Dict[type, bool] = {}
+
+
+def _takes_parent(view_cls: Type[QWidget]) -> bool:
+    """
+    Constructor probe via the code object (no inspect.signature).
+    """
+    takes = _TAKES_PARENT.get(view_cls)
+    if takes is None:
+        code = getattr(view_cls.__init__, "__code__", None)
+        if code is None:
+            takes = True  # Inherited Qt constructor: (parent=None)
+        else:
+            takes = code.co_argcount > 1 or bool(code.co_flags & _CO_VARARGS)
+        _TAKES_PARENT[view_cls] = takes
+
+    return takes
+
+
 class NavigationManager:
     """
     Central navigation controller using QStackedWidget.
@@ -28,12 +49,20 @@ class NavigationManager:
     - Safe constructor handling
     - Deterministic navigation
     - Lifecycle awareness
+    - Optional lazy construction (first navigation)
     """
 
     def __init__(self, container: QStackedWidget):
         self.container = container
         self._views: Dict[str, QWidget] = {}
+        self._pending: Dict[str, tuple[Type[QWidget], Optional[QWidget]]] = {}
+        self._aliases: Dict[str, str] = {}
+        self._ready_callbacks: Dict[str, List[Callable[[QWidget], None]]] = {}
         self._current_view_name: Optional[str] = None
+
+        # Lifecycle hooks resolved once per view at construction
+        self._on_navigate: Dict[str, Optional[Callable[[], None]]] = {}
+        self._on_leave: Dict[str, Optional[Callable[[], None]]] = {}
         self.logger = logging.getLogger("SOC.Navigation")
 
     # ==================================================
@@ -51,21 +80,64 @@ class NavigationManager:
 
         The view is instantiated exactly one time.
         """
-        if name in self._views:
+        if name in self._views or name in self._pending:
             self.logger.debug("View already registered: %s", name)
             return
 
+        self._instantiate(name, view_cls, parent)
+
+    def register_lazy(
+        self,
+        name: str,
+        view_cls: Type[QWidget],
+        parent: Optional[QWidget] = None
+    ):
+        """
+        Register a view that is built on first navigation.
+        """
+        if name in self._views or name in self._pending:
+            self.logger.debug("View already registered: %s", name)
+            return
+
+        self._pending[name] = (view_cls, parent)
+
+    def register_alias(self, alias: str, target: str):
+        """
+        Make `alias` resolve to the already registered view `target`.
+        """
+        if alias in self._views or alias in self._pending:
+            self.logger.debug("View already registered: %s", alias)
+            return
+
+        self._aliases[alias] = target
+
+    def when_ready(self, name: str, callback: Callable[[QWidget], None]):
+        """
+        Run callback(view) once the view exists (now, if it already does).
+        """
+        name = self._aliases.get(name, name)
+        view = self._views.get(name)
+        if view is not None:
+            callback(view)
+        else:
+            self._ready_callbacks.setdefault(name, []).append(callback)
+
+    def _instantiate(
+        self,
+        name: str,
+        view_cls: Type[QWidget],
+        parent: Optional[QWidget]
+    ) -> Optional[QWidget]:
         try:
             # ---------- SAFE CONSTRUCTOR HANDLING ----------
-            sig = inspect.signature(view_cls.__init__)
-            params = list(sig.parameters.values())[1:]  # drop self
-
-            if params:
+            if _takes_parent(view_cls):
                 view = view_cls(parent)
             else:
                 view = view_cls()
 
             self._views[name] = view
+            self._on_navigate[name] = getattr(view, "on_navigate", None)
+            self._on_leave[name] = getattr(view, "on_leave", None)
             self.container.addWidget(view)
 
             self.logger.info("View registered: %s", name)
@@ -77,6 +149,19 @@ class NavigationManager:
                 exc,
                 exc_info=True
             )
+            return None
+
+        for callback in self._ready_callbacks.pop(name, []):
+            try:
+                callback(view)
+            except Exception as exc:
+                self.logger.warning(
+                    "Ready callback failed for '%s': %s",
+                    name,
+                    exc
+                )
+
+        return view
 
     # ==================================================
     # NAVIGATION
@@ -86,32 +171,39 @@ class NavigationManager:
         """
         Switch to a registered view with lifecycle hooks.
         """
-        if name not in self._views:
-            self.logger.error("Unknown view requested: %s", name)
-            return
+        name = self._aliases.get(name, name)
+        view = self._views.get(name)
+        if view is None:
+            pending = self._pending.pop(name, None)
+            if pending is None:
+                self.logger.error("Unknown view requested: %s", name)
+                return
+
+            view = self._instantiate(name, *pending)
+            if view is None:
+                return
 
         # ---------- EXIT HOOK (OLD VIEW) ----------
-        if self._current_view_name:
-            old_view = self._views.get(self._current_view_name)
-            if old_view and hasattr(old_view, "on_leave"):
-                try:
-                    old_view.on_leave()
-                except Exception as exc:
-                    self.logger.warning(
-                        "on_leave() failed for '%s': %s",
-                        self._current_view_name,
-                        exc
-                    )
+        on_leave = self._on_leave.get(self._current_view_name)
+        if on_leave is not None:
+            try:
+                on_leave()
+            except Exception as exc:
+                self.logger.warning(
+                    "on_leave() failed for '%s': %s",
+                    self._current_view_name,
+                    exc
+                )
 
         # ---------- ENTER NEW VIEW ----------
-        view = self._views[name]
         self.container.setCurrentWidget(view)
         self._current_view_name = name
 
         # ---------- ENTER HOOK (NEW VIEW) ----------
-        if hasattr(view, "on_navigate"):
+        on_navigate = self._on_navigate[name]
+        if on_navigate is not None:
             try:
-                view.on_navigate()
+                on_navigate()
             except Exception as exc:
                 self.logger.warning(
                     "on_navigate() failed for '%s': %s",
@@ -129,7 +221,8 @@ class NavigationManager:
         return self._current_view_name
 
     def get_view(self, name: str) -> Optional[QWidget]:
-        return self._views.get(name)
+        return self._views.get(self._aliases.get(name, name))
 
     def has_view(self, name: str) -> bool:
-        return name in self._views
+        name = self._aliases.get(name, name)
+        return name in self._views or name in self._pending
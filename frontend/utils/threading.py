@@ -12,9 +12,10 @@ NO UI LOGIC
 NO BUSINESS LOGIC
 """
 
-from PySide6.QtCore import QObject, QThread, Signal
-from typing import Callable, Any, Optional, List
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from typing import Callable, Any, Optional
 import logging
+import os
 
 
 # ==================================================
@@ -35,17 +36,32 @@ class WorkerSignals(QObject):
 # GENERIC WORKER
 # ==================================================
 
-class Worker(QObject):
+def _accepts_progress(fn: Callable) -> bool:
     """
-    Generic worker object to execute a callable in a background thread.
+    True if fn declares a `progress_callback` parameter (not a local).
+    """
+    code = getattr(fn, "__code__", None)
+    if code is None:
+        return False
+
+    n_params = code.co_argcount + code.co_kwonlyargcount
+    return "progress_callback" in code.co_varnames[:n_params]
+
+
+class Worker(QRunnable):
+    """
+    Generic pooled task executing a callable on a worker thread.
     """
 
     def __init__(self, fn: Callable, *args, **kwargs):
         super().__init__()
+        # Python owns the task (ThreadManager releases it on finish)
+        self.setAutoDelete(False)
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
         self.signals = WorkerSignals()
+        self._wants_progress = _accepts_progress(fn)
 
     def run(self):
         """
@@ -53,7 +69,7 @@ class Worker(QObject):
         """
         try:
             # Optional progress callback support
-            if "progress_callback" in self.fn.__code__.co_varnames:
+            if self._wants_progress:
                 self.kwargs["progress_callback"] = self.signals.progress
 
             result = self.fn(*self.args, **self.kwargs)
@@ -74,13 +90,17 @@ class ThreadManager:
     """
     SOC-grade thread controller.
 
-    - Prevents premature thread destruction
-    - Tracks active threads
+    - Persistent worker pool (no per-task OS thread)
+    - Concurrency bounded by CPU count
     - EXE-safe
     """
 
-    def __init__(self):
-        self._threads: List[QThread] = []
+    def __init__(self, max_threads: Optional[int] = None):
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_threads or os.cpu_count() or 2)
+
+        # Tasks kept alive until their queued signals are delivered
+        self._active: set[Worker] = set()
         self.logger = logging.getLogger("SOC.Threads")
 
     def run(
@@ -95,7 +115,7 @@ class ThreadManager:
         thread_name: Optional[str] = None,
     ):
         """
-        Run a function in a background thread.
+        Run a function on the background pool.
 
         Args:
             fn (Callable): Function to execute
@@ -106,20 +126,10 @@ class ThreadManager:
         if kwargs is None:
             kwargs = {}
 
-        thread = QThread()
-        if thread_name:
-            thread.setObjectName(thread_name)
-
         worker = Worker(fn, *args, **kwargs)
-        worker.moveToThread(thread)
 
         # ---------------- SIGNAL WIRING ----------------
 
-        thread.started.connect(worker.run)
-        worker.signals.finished.connect(thread.quit)
-        worker.signals.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-
         if on_result:
             worker.signals.result.connect(on_result)
 
@@ -129,25 +139,15 @@ class ThreadManager:
         if on_finished:
             worker.signals.finished.connect(on_finished)
 
-        # Cleanup reference
-        thread.finished.connect(lambda: self._cleanup(thread))
-
-        self._threads.append(thread)
-        self.logger.debug("Thread started: %s", thread.objectName() or "unnamed")
+        self._active.add(worker)
+        worker.signals.finished.connect(lambda: self._active.discard(worker))
 
-        thread.start()
+        self.logger.debug("Task queued: %s", thread_name or "unnamed")
 
-    # ==================================================
-    # INTERNAL
-    # ==================================================
+        self._pool.start(worker)
 
-    def _cleanup(self, thread: QThread):
+    def wait_for_done(self, msecs: int = -1) -> bool:
         """
-        Remove finished thread safely.
+        Block until queued tasks finish (e.g. on shutdown).
         """
-        if thread in self._threads:
-            self._threads.remove(thread)
-            self.logger.debug(
-                "Thread cleaned up: %s",
-                thread.objectName() or "unnamed"
-            )
+        return self._pool.waitForDone(msecs)
@@ -17,17 +17,13 @@ from PySide6.QtWidgets import (
     QFrame,
     QSizePolicy
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
 
 from analytics.stats import severity_counts, top_offender_ips
-from analytics.charts import (
-    severity_distribution_chart,
-    top_offenders_chart
-)
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
+# matplotlib (and analytics.charts, which pulls it in) is imported on the
+# first render with data: the dashboard opens without paying for it
 
 
 # ==================================================
@@ -73,6 +69,8 @@ class AnalyticsView(QWidget):
         super().__init__(parent)
 
         self._last_detections: list = []
+        self._dirty = True
+        self._render_scheduled = False
         self._build_ui()
 
     # ==================================================
@@ -116,6 +114,10 @@ class AnalyticsView(QWidget):
         self.chart_layout.setSpacing(10)
         self.chart_layout.setContentsMargins(10, 10, 10, 10)
 
+        # Persistent canvases (created on first render with data)
+        self._canvas_sev = None
+        self._canvas_top = None
+
         # ---------- EMPTY STATE ----------
         self.empty_label = QLabel(
             "No detections yet.\nRun log analysis to populate SOC analytics."
@@ -137,23 +139,43 @@ class AnalyticsView(QWidget):
     # ==================================================
 
     def update_analytics(self, detections: list):
+        """
+        Store new detections; repaint is coalesced via the event loop.
+
+        Hidden views only mark themselves dirty and render on navigate.
+        """
         self._last_detections = detections or []
-        self._render()
+        self._dirty = True
+
+        if self.isVisible() and not self._render_scheduled:
+            self._render_scheduled = True
+            QTimer.singleShot(0, self, self._render_if_dirty)
 
     def on_navigate(self):
-        self._render()
+        self._render_if_dirty()
+
+    def _render_if_dirty(self):
+        self._render_scheduled = False
+        if self._dirty:
+            self._render()
 
     # ==================================================
     # RENDERING
     # ==================================================
 
     def _render(self):
-        self._clear_charts()
+        self._dirty = False
 
         if not self._last_detections:
             self._set_empty_state(True)
             return
 
+        from analytics.charts import (
+            severity_distribution_chart,
+            top_offenders_chart
+        )
+
+        self._ensure_canvases()
         self._set_empty_state(False)
 
         sev_counts = severity_counts(self._last_detections)
@@ -164,21 +186,12 @@ class AnalyticsView(QWidget):
         self.low_card.set_value(sev_counts.get("Low", 0))
 
         # ---------- CHARTS ----------
-        fig1 = severity_distribution_chart(sev_counts)
-        if fig1:
-            canvas1 = FigureCanvas(fig1)
-            self.chart_layout.addWidget(canvas1)
-            canvas1.draw()
-            plt.close(fig1)
+        fig1 = severity_distribution_chart(sev_counts, fig=self._canvas_sev.figure)
+        self._show_chart(self._canvas_sev, fig1 is not None)
 
         top_ips = top_offender_ips(self._last_detections)
-        if top_ips:
-            fig2 = top_offenders_chart(top_ips)
-            if fig2:
-                canvas2 = FigureCanvas(fig2)
-                self.chart_layout.addWidget(canvas2)
-                canvas2.draw()
-                plt.close(fig2)
+        fig2 = top_offenders_chart(top_ips, fig=self._canvas_top.figure) if top_ips else None
+        self._show_chart(self._canvas_top, fig2 is not None)
 
     # ==================================================
     # STATES
@@ -195,13 +208,27 @@ class AnalyticsView(QWidget):
             self.low_card.set_value(0)
 
     # ==================================================
-    # CLEANUP
+    # HELPERS
     # ==================================================
 
-    def _clear_charts(self):
-        while self.chart_layout.count():
-            item = self.chart_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
-                widget.deleteLater()
+    def _ensure_canvases(self):
+        """
+        Create both chart canvases once; each update redraws into them.
+        """
+        if self._canvas_sev is not None:
+            return
+
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
+        self._canvas_sev = FigureCanvas(Figure(figsize=(6, 4)))
+        self._canvas_top = FigureCanvas(Figure(figsize=(7, 4)))
+
+        for canvas in (self._canvas_sev, self._canvas_top):
+            canvas.setVisible(False)
+            self.chart_layout.addWidget(canvas)
+
+    def _show_chart(self, canvas, has_data: bool):
+        canvas.setVisible(has_data)
+        if has_data:
+            canvas.draw_idle()
@@ -11,16 +11,58 @@ Read-only forensic panel.
 """
 
 import json
+from operator import itemgetter
+
 from PySide6.QtWidgets import (
     QWidget, QLabel, QPushButton,
     QVBoxLayout, QHBoxLayout,
     QTableWidget, QTableWidgetItem,
     QMessageBox
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import Qt, QTimer, QSignalBlocker
+from PySide6.QtGui import QFont, QColor, QBrush
 
 from config.settings import BLOCKED_IPS_FILE
+from frontend.utils.threading import ThreadManager
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _load_json(path):
+    """
+    Parse a JSON file (orjson when installed, else stdlib).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _load_sorted_blocks() -> list:
+    """
+    Read the block history as (blocked_at, ip, info) rows, newest first.
+
+    Pure (no Qt) — runs on a worker thread.
+    """
+    if not BLOCKED_IPS_FILE.exists():
+        return []
+
+    data = _load_json(BLOCKED_IPS_FILE)
+    if not data:
+        return []
+
+    # Key extracted once per entry
+    rows = [
+        (info.get("blocked_at", ""), ip, info)
+        for ip, info in data.items()
+    ]
+    rows.sort(key=itemgetter(0), reverse=True)
+    return rows
 
 
 class BlockedIPsView(QWidget):
@@ -28,9 +70,28 @@ class BlockedIPsView(QWidget):
     Read-only SOC firewall block history view.
     """
 
-    def __init__(self, parent=None):
+    # IOC row highlight (shared, not rebuilt per cell)
+    _IOC_BG = QBrush(QColor("#7f1d1d"))
+    _IOC_FG = QBrush(Qt.white)
+    _DEFAULT_BRUSH = QBrush()  # NoBrush → style default
+
+    _CENTERED_COLS = frozenset({2, 4, 5})
+
+    def __init__(self, parent=None, thread_manager: ThreadManager | None = None):
         super().__init__(parent)
 
+        # File read + parse + sort run off the UI thread, on the
+        # dashboard's shared pool (own single lane when used standalone)
+        self._threads = thread_manager or ThreadManager(max_threads=1)
+        self._loading = False
+        self._reload_requested = False
+
+        # Event-driven refreshes coalesce into at most one per 250 ms
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(250)
+        self._refresh_timer.timeout.connect(self.load_blocked_ips)
+
         self._build_ui()
         self.load_blocked_ips()
 
@@ -95,56 +156,52 @@ class BlockedIPsView(QWidget):
 
     def load_blocked_ips(self):
         """
-        Load firewall block history safely.
+        Load firewall block history safely (parsed in the background).
+
+        Requests made while a load is running collapse into one reload.
         """
-        self.table.setRowCount(0)
+        if self._loading:
+            self._reload_requested = True
+            return
 
-        if not BLOCKED_IPS_FILE.exists():
+        self._loading = True
+        self._threads.run(
+            _load_sorted_blocks,
+            on_result=self._populate,
+            on_error=self._on_load_error,
+            on_finished=self._on_load_finished,
+            thread_name="blocked-ips-load"
+        )
+
+    def schedule_refresh(self):
+        """
+        Request a reload; bursts within the interval collapse into one.
+        """
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _populate(self, rows):
+        if not rows:
+            self.table.setRowCount(0)
             self._set_empty_state(True)
             return
 
-        try:
-            with open(BLOCKED_IPS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if not data:
-                self._set_empty_state(True)
-                return
-
-            # Sort newest → oldest
-            sorted_items = sorted(
-                data.items(),
-                key=lambda item: item[1].get("blocked_at", ""),
-                reverse=True
-            )
-
-            self.table.setRowCount(len(sorted_items))
-            self._set_empty_state(False)
-
-            for row, (ip, info) in enumerate(sorted_items):
-                ioc = info.get("ioc_confirmed", False)
-
-                self._set_item(row, 0, ip)
-                self._set_item(row, 1, info.get("reason", "Unknown"))
-                self._set_item(row, 2, "YES" if ioc else "NO", center=True)
-                self._set_item(row, 3, info.get("blocked_at", "Unknown"))
-                self._set_item(row, 4, info.get("os", "Unknown"), center=True)
-                self._set_item(row, 5, info.get("method", "Unknown"), center=True)
-
-                # 🔥 Highlight IOC-confirmed blocks
-                if ioc:
-                    for col in range(self.table.columnCount()):
-                        item = self.table.item(row, col)
-                        if item:
-                            item.setBackground(QColor("#7f1d1d"))
-                            item.setForeground(Qt.white)
-
-        except Exception as exc:
-            QMessageBox.critical(
-                self,
-                "Blocked IP History Error",
-                f"Failed to load firewall history:\n{exc}"
-            )
+        self._set_empty_state(False)
+        self._fill_table(rows)
+
+    def _on_load_error(self, message: str):
+        self.table.setRowCount(0)
+        QMessageBox.critical(
+            self,
+            "Blocked IP History Error",
+            f"Failed to load firewall history:\n{message}"
+        )
+
+    def _on_load_finished(self):
+        self._loading = False
+        if self._reload_requested:
+            self._reload_requested = False
+            self.load_blocked_ips()
 
     # ==================================================
     # NAVIGATION HOOK
@@ -168,8 +225,58 @@ class BlockedIPsView(QWidget):
     # HELPERS
     # ==================================================
 
+    def _fill_table(self, rows):
+        """
+        Populate all rows with repaints, signals and sorting suspended.
+
+        Cells already in the table are updated in place; items are only
+        allocated for rows beyond the previous row count.
+        """
+        table = self.table
+        sorting = table.isSortingEnabled()
+
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        try:
+            # Widget-level itemChanged etc. stay silent until the end (the
+            # model keeps signalling: the view itself depends on that)
+            with QSignalBlocker(table):
+                # Shrinking drops (and deletes) surplus rows; growing adds empty ones
+                table.setRowCount(len(rows))
+
+                for row, (_, ip, info) in enumerate(rows):
+                    ioc = info.get("ioc_confirmed", False)
+
+                    # 🔥 Highlight IOC-confirmed blocks
+                    if ioc:
+                        background, foreground = self._IOC_BG, self._IOC_FG
+                    else:
+                        background, foreground = self._DEFAULT_BRUSH, self._DEFAULT_BRUSH
+
+                    cells = (
+                        ip,
+                        info.get("reason", "Unknown"),
+                        "YES" if ioc else "NO",
+                        info.get("blocked_at", "Unknown"),
+                        info.get("os", "Unknown"),
+                        info.get("method", "Unknown"),
+                    )
+
+                    for col, text in enumerate(cells):
+                        item = table.item(row, col)
+                        if item is None:
+                            item = self._set_item(row, col, "", center=col in self._CENTERED_COLS)
+
+                        item.setText(str(text))
+                        item.setBackground(background)
+                        item.setForeground(foreground)
+        finally:
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
+
     def _set_item(self, row, col, text, center=False):
         item = QTableWidgetItem(str(text))
         if center:
             item.setTextAlignment(Qt.AlignCenter)
         self.table.setItem(row, col, item)
+        return item
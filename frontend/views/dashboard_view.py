@@ -21,6 +21,7 @@ from PySide6.QtWidgets import (
     QFrame
 )
 from PySide6.QtCore import Qt
+from functools import partial
 
 # ---------------- CORE UI ----------------
 from frontend.widgets.header import Header
@@ -28,6 +29,7 @@ from frontend.widgets.sidebar import Sidebar
 
 # ---------------- NAVIGATION ----------------
 from frontend.utils.navigation import NavigationManager
+from frontend.utils.threading import ThreadManager
 
 # ---------------- SOC VIEWS ----------------
 from frontend.views.log_viewer_view import LogViewer
@@ -49,6 +51,9 @@ class DashboardView(QWidget):
 
         self.user = user or {}
 
+        # Background pool shared by the views (no per-view QThreadPool)
+        self.threads = ThreadManager()
+
         self._build_ui()
         self._register_views()
         self._connect_signals()
@@ -102,19 +107,26 @@ class DashboardView(QWidget):
     def _register_views(self):
         """
         Register all SOC views (single instance each).
+
+        The analytics panel is built up front (it collects detections
+        from other views); the rest are built on first visit.
         """
 
-        # Dashboard landing
-        self.navigator.register_view("dashboard", AnalyticsView, self)
+        # Dashboard landing (one AnalyticsView serves both entries)
         self.navigator.register_view("analytics", AnalyticsView, self)
-
-        # Core SOC views
-        self.navigator.register_view("log_viewer", LogViewer, self)
-        self.navigator.register_view("live_logs", LiveLogView, self)
-        self.navigator.register_view("watchtower", WatchtowerView, self)
-        self.navigator.register_view("blocked_ips", BlockedIPsView, self)
-        self.navigator.register_view("rules", RulesViewer, self)
-        self.navigator.register_view("project_info", ProjectInfoView, self)
+        self.navigator.register_alias("dashboard", "analytics")
+
+        # Core SOC views (lazy)
+        self.navigator.register_lazy("log_viewer", LogViewer, self)
+        self.navigator.register_lazy("live_logs", LiveLogView, self)
+        self.navigator.register_lazy("watchtower", WatchtowerView, self)
+        self.navigator.register_lazy(
+            "blocked_ips",
+            partial(BlockedIPsView, thread_manager=self.threads),
+            self
+        )
+        self.navigator.register_lazy("rules", RulesViewer, self)
+        self.navigator.register_lazy("project_info", ProjectInfoView, self)
 
         # Default landing
         self.navigator.navigate("dashboard")
@@ -135,26 +147,32 @@ class DashboardView(QWidget):
     def _wire_soc_events(self):
         """
         Wire detection events → analytics & blocked IP panels.
+
+        Sources are lazy views, so wiring happens when each is built.
         """
 
         analytics: AnalyticsView | None = self.navigator.get_view("analytics")
-        blocked_ips: BlockedIPsView | None = self.navigator.get_view("blocked_ips")
 
-        log_viewer: LogViewer | None = self.navigator.get_view("log_viewer")
-        if log_viewer:
+        def wire_log_viewer(log_viewer: LogViewer):
             # Detection → Analytics
             if analytics:
                 log_viewer.analytics_ready.connect(analytics.update_analytics)
 
             # Detection → Blocked IPs refresh
-            if blocked_ips:
-                log_viewer.analytics_ready.connect(
-                    lambda _: blocked_ips.load_blocked_ips()
-                )
+            log_viewer.analytics_ready.connect(self._refresh_blocked_ips)
 
-        live_logs: LiveLogView | None = self.navigator.get_view("live_logs")
-        if live_logs and analytics:
-            live_logs.analytics_ready.connect(analytics.update_analytics)
+        def wire_live_logs(live_logs: LiveLogView):
+            if analytics:
+                live_logs.analytics_ready.connect(analytics.update_analytics)
+
+        self.navigator.when_ready("log_viewer", wire_log_viewer)
+        self.navigator.when_ready("live_logs", wire_live_logs)
+
+    def _refresh_blocked_ips(self, _detections=None):
+        # Not built yet → it reads the current list on first visit
+        blocked_ips: BlockedIPsView | None = self.navigator.get_view("blocked_ips")
+        if blocked_ips:
+            blocked_ips.schedule_refresh()
 
     # ==================================================
     # ACTION DELEGATION
@@ -165,3 +183,31 @@ class DashboardView(QWidget):
 
     def _logout(self):
         self.window().logout()
+
+    # ==================================================
+    # SESSION LIFECYCLE
+    # ==================================================
+
+    def set_user(self, user: dict):
+        self.user = user or {}
+        self.header.update_user(self.user)
+
+    def reset_for_logout(self):
+        """
+        Clear per-user state so the widget tree can be reused
+        by the next login instead of being rebuilt.
+        """
+        self.set_user({})
+
+        self.navigator.navigate("dashboard")
+        self.sidebar.set_active("dashboard")
+
+        analytics: AnalyticsView | None = self.navigator.get_view("analytics")
+        if analytics:
+            analytics.update_analytics([])
+
+        # Lazy views that were never opened hold no state
+        for name in ("log_viewer", "live_logs", "watchtower"):
+            view = self.navigator.get_view(name)
+            if view:
+                view.reset()
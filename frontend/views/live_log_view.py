@@ -14,15 +14,19 @@ SOC-grade real-time log streaming & detection view.
 from PySide6.QtWidgets import (
     QWidget, QPushButton, QLabel, QFileDialog,
     QVBoxLayout, QHBoxLayout, QSplitter,
-    QTableWidget, QTableWidgetItem, QMessageBox
+    QTableView
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from collections import deque
+
+from PySide6.QtCore import Qt, QThread, QTimer, QFileSystemWatcher, Signal
 
 from monitoring.live_tail import LiveLogTailer
 from core.parser import parse_log_line
 from core.normalizer import normalize_log_entry
 from core.detector import DetectionEngine
+from core.bloom import BloomFilter
 from response.responder import ResponseEngine
+from frontend.widgets.tables import RingTableModel
 
 try:
     from intelligence.ioc_loader import get_ioc_engine
@@ -39,42 +43,107 @@ class LiveTailWorker(QThread):
     """
     Background log tailer worker.
     Handles detection in BATCH to avoid alert spam.
+
+    Reads are driven by file-change notifications (inotify /
+    ReadDirectoryChangesW) in this thread's event loop — no busy
+    polling while the file is idle.
     """
 
-    new_entry = Signal(dict)
+    # Safety net for missed notifications (network shares, rotation,
+    # file not created yet)
+    FALLBACK_POLL_MS = 2000
+
     detection_found = Signal(dict)
     analytics_update = Signal(list)
     status = Signal(str)
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        detector: DetectionEngine,
+        responder: ResponseEngine,
+        format_row
+    ):
         super().__init__()
 
-        ioc_engine = get_ioc_engine() if IOC_AVAILABLE else None
-        self.detector = DetectionEngine(ioc_engine=ioc_engine)
-        self.responder = ResponseEngine()
+        # Engines are owned by the view (built once, reused per tail)
+        self.detector = detector
+        self.responder = responder
 
         self.file_path = file_path
         self.tailer = None
         self.running = True
 
-        self.seen_alerts: set[tuple] = set()
+        # Fixed memory however long the tail runs (rare false positive
+        # = one suppressed duplicate-looking alert)
+        self.seen_alerts = BloomFilter(capacity=100_000)
+
+        # Display rows awaiting the view's next flush (deque append /
+        # popleft are atomic → no lock between tailer and GUI thread).
+        # Rows are stringified here, not on the GUI thread.
+        self.format_row = format_row
+        self._pending: deque = deque()
         self.detections: list[dict] = []
 
     def run(self):
+        if IOC_AVAILABLE and self.detector.ioc_engine is None:
+            self.detector.ioc_engine = get_ioc_engine()
+
         self.tailer = LiveLogTailer(
             file_path=self.file_path,
             callback=self._on_new_line
         )
+
+        # Created here → owned by this thread; plain callables (not
+        # methods of this QThread object, which lives in the GUI
+        # thread) keep the reads in this thread
+        watcher = QFileSystemWatcher()
+        fallback = QTimer()
+        fallback.setInterval(self.FALLBACK_POLL_MS)
+
+        def read_new(*_):
+            if not self.running:
+                return
+            try:
+                self.tailer.poll()
+            except FileNotFoundError:
+                pass  # Rotated away / not created yet → retried
+            except Exception as exc:
+                self.tailer.logger.error("Live tail read failed: %s", exc)
+
+            # Replaced files drop out of the watch list
+            if self.file_path not in watcher.files():
+                watcher.addPath(self.file_path)
+
+        watcher.fileChanged.connect(read_new)
+        fallback.timeout.connect(read_new)
+
+        read_new()  # Opens at EOF
+        fallback.start()
         self.status.emit(f"Started live tailing: {self.file_path}")
-        self.tailer.start()
+
+        self.exec()
+
+        fallback.stop()
+        self.tailer.close()
 
     def stop(self):
         self.running = False
-        if self.tailer:
-            self.tailer.stop()
         self.quit()
         self.wait()
 
+    def drain_rows(self) -> list[tuple]:
+        """
+        Take every row queued since the last call (GUI thread).
+        """
+        pending = self._pending
+        rows = []
+        try:
+            while True:
+                rows.append(pending.popleft())
+        except IndexError:
+            return rows
+
     # ---------------- CALLBACK ----------------
 
     def _on_new_line(self, line: str):
@@ -84,18 +153,16 @@ class LiveTailWorker(QThread):
         parsed = parse_log_line(line)
         normalized = normalize_log_entry(parsed)
 
-        # UI update
-        self.new_entry.emit(normalized)
+        # UI update (drained in batches by the view)
+        self._pending.append(self.format_row(normalized))
 
         detections = self.detector.analyze_entry(normalized)
         new_detections: list[dict] = []
 
         for d in detections:
-            key = (d["severity"], d["rule"], d["ip"])
-            if key in self.seen_alerts:
+            if not self.seen_alerts.add(d["dedup_key"]):
                 continue
 
-            self.seen_alerts.add(key)
             self.detections.append(d)
             new_detections.append(d)
 
@@ -118,10 +185,24 @@ class LiveLogView(QWidget):
 
     analytics_ready = Signal(list)
 
+    # Newest-first row caps (ring buffers: raising them costs memory only)
+    LOG_ROWS = 500
+    ALERT_ROWS = 200
+
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
 
+        # IOC engine is resolved by the tail worker, not at view build
+        self.engine = DetectionEngine()
+        self.responder = ResponseEngine()
+
         self.worker: LiveTailWorker | None = None
+
+        # Live rows reach the table at most ~10×/s, whatever the log rate
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_entries)
+
         self._build_ui()
 
     # ==================================================
@@ -149,30 +230,50 @@ class LiveLogView(QWidget):
         toolbar.addStretch()
         toolbar.addWidget(ioc_label)
 
+        # ---------- STATUS ----------
+        self.status_label = QLabel("Idle — select a log file to start live tailing")
+        self.status_label.setStyleSheet("color: #9ca3af;")
+
         # ---------- TABLES ----------
         splitter = QSplitter(Qt.Horizontal)
 
-        # Live Logs
-        self.log_table = QTableWidget(0, 3)
-        self.log_table.setHorizontalHeaderLabels(
-            ["TIME", "IP", "REQUEST"]
+        # Live Logs (newest first)
+        self.log_model = RingTableModel(
+            [
+                ("TIME", lambda e: e.get("time")),
+                ("IP", lambda e: e.get("ip")),
+                ("REQUEST", lambda e: e.get("normalized_request")),
+            ],
+            capacity=self.LOG_ROWS
         )
-        self.log_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.log_table.setSelectionBehavior(QTableWidget.SelectRows)
-
-        # Alerts
-        self.alert_table = QTableWidget(0, 5)
-        self.alert_table.setHorizontalHeaderLabels(
-            ["SEVERITY", "RULE", "IP", "TIME", "IOC"]
+        self.log_table = QTableView()
+        self.log_table.setModel(self.log_model)
+        self.log_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.log_table.setSelectionBehavior(QTableView.SelectRows)
+
+        # Alerts (newest first)
+        self.alert_model = RingTableModel(
+            [
+                ("SEVERITY", lambda d: d["severity"]),
+                ("RULE", lambda d: d["rule"]),
+                ("IP", lambda d: d["ip"]),
+                ("TIME", lambda d: d["time"]),
+                ("IOC", lambda d: "🧠 IOC" if d.get("ioc_hit") else ""),
+            ],
+            capacity=self.ALERT_ROWS,
+            centered=True
         )
-        self.alert_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.alert_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.alert_table = QTableView()
+        self.alert_table.setModel(self.alert_model)
+        self.alert_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.alert_table.setSelectionBehavior(QTableView.SelectRows)
 
         splitter.addWidget(self.log_table)
         splitter.addWidget(self.alert_table)
         splitter.setSizes([700, 500])
 
         main_layout.addLayout(toolbar)
+        main_layout.addWidget(self.status_label)
         main_layout.addWidget(splitter)
 
     # ==================================================
@@ -203,73 +304,59 @@ class LiveLogView(QWidget):
 
     def start_tail(self, path: str):
         if self.worker:
-            QMessageBox.information(
-                self,
-                "Live Tail",
-                "Already tailing a file."
-            )
+            self._show_status("Already tailing a file — stop it first")
             return
 
-        self.log_table.setRowCount(0)
-        self.alert_table.setRowCount(0)
+        self.log_model.clear()
+        self.alert_model.clear()
+
+        # Shared responder → new tail = new run (one PDF per run)
+        self.responder.start_new_run()
 
-        self.worker = LiveTailWorker(path)
-        self.worker.new_entry.connect(self._insert_log_row)
+        self.worker = LiveTailWorker(
+            path, self.engine, self.responder, self.log_model.format_row
+        )
         self.worker.detection_found.connect(self._insert_alert)
         self.worker.analytics_update.connect(self.analytics_ready.emit)
         self.worker.status.connect(self._show_status)
 
         self.worker.start()
+        self._flush_timer.start()
 
     def stop_tail(self):
         if self.worker:
+            self._flush_timer.stop()
             self.worker.stop()
+            self._flush_entries()
             self.worker = None
+            self._show_status("⏹ Live tail stopped")
+
+    def reset(self):
+        """
+        Stop tailing and clear tables (dashboard reused after logout).
+        """
+        self.stop_tail()
+        self.log_model.clear()
+        self.alert_model.clear()
+        self.status_label.setText("Idle — select a log file to start live tailing")
 
     # ==================================================
     # UI INSERT
     # ==================================================
 
-    def _insert_log_row(self, entry: dict):
-        self.log_table.insertRow(0)
-
-        values = [
-            entry.get("time"),
-            entry.get("ip"),
-            entry.get("normalized_request"),
-        ]
-
-        for col, val in enumerate(values):
-            self.log_table.setItem(
-                0, col,
-                QTableWidgetItem(str(val))
-            )
-
-        if self.log_table.rowCount() > 500:
-            self.log_table.removeRow(self.log_table.rowCount() - 1)
+    def _flush_entries(self):
+        if self.worker:
+            rows = self.worker.drain_rows()
+            if rows:
+                self.log_model.push_formatted(rows)
 
     def _insert_alert(self, d: dict):
-        self.alert_table.insertRow(0)
-
-        values = [
-            d["severity"],
-            d["rule"],
-            d["ip"],
-            d["time"],
-            "🧠 IOC" if d.get("ioc_hit") else "",
-        ]
-
-        for col, val in enumerate(values):
-            item = QTableWidgetItem(str(val))
-            item.setTextAlignment(Qt.AlignCenter)
-            self.alert_table.setItem(0, col, item)
-
-        if self.alert_table.rowCount() > 200:
-            self.alert_table.removeRow(self.alert_table.rowCount() - 1)
+        self.alert_model.push(d)
 
     # ==================================================
     # STATUS
     # ==================================================
 
     def _show_status(self, msg: str):
-        QMessageBox.information(self, "Live Tail", msg)
+        # Inline label, not a modal box: start/stop never block the UI
+        self.status_label.setText(msg)
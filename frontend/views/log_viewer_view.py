@@ -11,21 +11,24 @@ Thread-safe, EXE-safe, enterprise SOC-grade log analysis view.
 """
 
 import os
+import threading
+import time
 
 from PySide6.QtWidgets import (
     QWidget, QPushButton, QLabel, QFileDialog,
     QVBoxLayout, QHBoxLayout, QSplitter,
-    QTableWidget, QTableWidgetItem, QMessageBox,
+    QTableView, QMessageBox,
     QProgressBar, QHeaderView
 )
 from PySide6.QtCore import Qt, Signal, QThread
 from PySide6.QtGui import QColor
 
-from core.parser import parse_log_line
-from core.normalizer import normalize_log_entry
+from core.parser import parse_log_file_parallel, PARALLEL_MIN_BYTES
+from core.normalizer import normalize_batch
 from core.detector import DetectionEngine
 from response.responder import ResponseEngine
 from config.settings import PDF_REPORT_DIR
+from frontend.widgets.tables import RecordTableModel
 
 try:
     from intelligence.ioc_loader import get_ioc_engine
@@ -34,61 +37,144 @@ except ImportError:
     IOC_AVAILABLE = False
 
 
+SEVERITY_COLORS = {
+    "Critical": QColor("#7f1d1d"),
+    "High": QColor("#b45309"),
+    "Medium": QColor("#1e40af"),
+    "Low": QColor("#166534"),
+}
+
+
 # ==================================================
 # BACKGROUND WORKERS
 # ==================================================
 
 class LogLoaderWorker(QThread):
-    log_loaded = Signal(dict)
+    # Entries are sent in batches: one cross-thread signal per BATCH_SIZE,
+    # together with their display rows (stringified in this thread)
+    logs_loaded = Signal(list, list)
     finished = Signal(int)
     error = Signal(str)
 
-    def __init__(self, path: str):
+    BATCH_SIZE = 500
+
+    def __init__(self, path: str, format_rows):
         super().__init__()
         self.path = path
+        self.format_rows = format_rows
 
     def run(self):
         count = 0
         try:
-            with open(self.path, "r", encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    entry = normalize_log_entry(parse_log_line(line))
-                    self.log_loaded.emit(entry)
-                    count += 1
+            # Normalized blocks in file order (process pool for big files)
+            for block in parse_log_file_parallel(self.path, transform=normalize_batch):
+                for i in range(0, len(block), self.BATCH_SIZE):
+                    if self.isInterruptionRequested():
+                        return  # Superseded by a newer load
+
+                    batch = block[i:i + self.BATCH_SIZE]
+                    self.logs_loaded.emit(batch, self.format_rows(batch))
+                    count += len(batch)
+
             self.finished.emit(count)
         except Exception as exc:
             self.error.emit(str(exc))
 
 
 class DetectionWorker(QThread):
-    detection_found = Signal(dict)
+    """
+    Runs detection over `entries`.
+
+    While `load_done` is unset the list is still being filled by the
+    loader: the worker keeps consuming new entries as they arrive and
+    stops once loading has finished and everything is processed.
+
+    With `parallel` (large file) and loading already finished, rule
+    scanning runs over a process pool instead.
+    """
+
+    detections_found = Signal(list)
     finished = Signal(list)
 
-    def __init__(self, entries, engine, responder):
+    # New alerts reach the GUI in batches (≤ one signal per interval)
+    EMIT_INTERVAL = 0.1
+
+    def __init__(self, entries, engine, responder, load_done=None, parallel=False):
         super().__init__()
         self.entries = entries
         self.engine = engine
         self.responder = responder
-        self._seen = set()
+        self.load_done = load_done
+        self.parallel = parallel
+        # Detection dedup_key ints (one machine-word hash per alert)
+        self._seen: set[int] = set()
+
+    def _stream(self):
+        entries = self.entries
+        done = self.load_done
+        i = 0
+
+        while True:
+            # Read the flag BEFORE the length: once set, no more appends
+            finished = done is None or done.is_set()
+
+            n = len(entries)
+            while i < n:
+                if i % 1024 == 0 and self.isInterruptionRequested():
+                    return
+                yield entries[i]
+                i += 1
+
+            if finished or self.isInterruptionRequested():
+                return
+
+            done.wait(0.05)
+
+    def _detections(self):
+        done = self.load_done
+        if self.parallel and (done is None or done.is_set()):
+            return self.engine.analyze_batch_parallel(self.entries)
+
+        return self.engine.analyze_stream(self._stream())
 
     def run(self):
+        if IOC_AVAILABLE and self.engine.ioc_engine is None:
+            self.engine.ioc_engine = get_ioc_engine()
+
         detections = []
+        pending = []
+        last_emit = time.monotonic()
+
+        for d in self._detections():
+            key = d["dedup_key"]
+            if key in self._seen:
+                continue
+
+            self._seen.add(key)
+            detections.append(d)
+            pending.append(d)
 
-        for entry in self.entries:
-            for d in self.engine.analyze_entry(entry):
-                key = (d["severity"], d["rule"], d["ip"])
-                if key in self._seen:
-                    continue
+            now = time.monotonic()
+            if now - last_emit >= self.EMIT_INTERVAL:
+                self._publish(pending)
+                pending = []
+                last_emit = now
 
-                self._seen.add(key)
-                detections.append(d)
+        if self.isInterruptionRequested():
+            return  # Cancelled (view reset): no further response or results
 
-                # 🔔 SOC response pipeline
-                self.responder.handle_detection(d)
-                self.detection_found.emit(d)
+        if pending:
+            self._publish(pending)
 
         self.finished.emit(detections)
 
+    def _publish(self, batch: list):
+        self.detections_found.emit(batch)
+
+        # 🔔 SOC response per alert batch (firewall stays near real time;
+        # one email per batch, one PDF per run)
+        self.responder.handle_bulk_detections(batch)
+
 
 # ==================================================
 # MAIN VIEW
@@ -101,16 +187,30 @@ class LogViewer(QWidget):
 
     analytics_ready = Signal(list)
 
+    # Rows kept in the log table (detection still sees every entry)
+    LOG_TABLE_ROWS = 10_000
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        ioc_engine = get_ioc_engine() if IOC_AVAILABLE else None
-        self.engine = DetectionEngine(ioc_engine=ioc_engine)
+        # IOC feeds are attached by the first worker (off the GUI thread)
+        self.engine = DetectionEngine()
 
         # 🔴 SINGLE ResponseEngine instance
         self.responder = ResponseEngine()
 
         self.parsed_logs = []
+        self._large_file = False
+
+        # Current workers; superseded ones stay referenced until they exit
+        self.loader = None
+        self.detector = None
+        self._retired: list[QThread] = []
+
+        # Set ⇔ no load in progress (a streaming detector waits on it)
+        self._load_done = threading.Event()
+        self._load_done.set()
+        self._detecting = False
 
         self._build_ui()
 
@@ -162,24 +262,37 @@ class LogViewer(QWidget):
         splitter = QSplitter(Qt.Horizontal)
 
         # ---- LOG TABLE ----
-        self.log_table = QTableWidget(0, 4)
-        self.log_table.setHorizontalHeaderLabels(
-            ["TIME", "IP", "STATUS", "REQUEST"]
-        )
-        self.log_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.log_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.log_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.log_model = RecordTableModel([
+            ("TIME", "time"),
+            ("IP", "ip"),
+            ("STATUS", "status"),
+            ("REQUEST", "normalized_request"),
+        ], max_rows=self.LOG_TABLE_ROWS)
+        self.log_table = QTableView()
+        self.log_table.setModel(self.log_model)
+        self.log_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.log_table.setSelectionBehavior(QTableView.SelectRows)
+        self.log_table.setSelectionMode(QTableView.SingleSelection)
         self.log_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.log_table.verticalHeader().setVisible(False)
 
         # ---- ALERT TABLE ----
-        self.alert_table = QTableWidget(0, 5)
-        self.alert_table.setHorizontalHeaderLabels(
-            ["SEVERITY", "RULE", "IP", "TIME", "IOC"]
+        self.alert_model = RecordTableModel(
+            [
+                ("SEVERITY", lambda d: d.get("severity")),
+                ("RULE", lambda d: d.get("rule")),
+                ("IP", lambda d: d.get("ip")),
+                ("TIME", lambda d: d.get("time")),
+                ("IOC", lambda d: "IOC" if d.get("ioc_hit") else ""),
+            ],
+            centered=True,
+            severity_colors=SEVERITY_COLORS
         )
-        self.alert_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.alert_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.alert_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.alert_table = QTableView()
+        self.alert_table.setModel(self.alert_model)
+        self.alert_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.alert_table.setSelectionBehavior(QTableView.SelectRows)
+        self.alert_table.setSelectionMode(QTableView.SingleSelection)
         self.alert_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.alert_table.verticalHeader().setVisible(False)
 
@@ -204,49 +317,82 @@ class LogViewer(QWidget):
         if not path:
             return
 
-        self.parsed_logs.clear()
-        self.log_table.setRowCount(0)
-        self.alert_table.setRowCount(0)
+        # Fresh list: a detector still following the previous load
+        # keeps its own (and is released by setting its event)
+        self._retire(self.loader)
+        self._load_done.set()
+        self._load_done = threading.Event()
+        self.parsed_logs = []
+
+        # Same cut-over as the parser's process pool
+        try:
+            self._large_file = os.path.getsize(path) >= PARALLEL_MIN_BYTES
+        except OSError:
+            self._large_file = False
+
+        self.log_model.clear()
+        self.alert_model.clear()
 
         self.status_label.setText("📥 Loading logs…")
         self.progress.setVisible(True)
 
-        self.loader = LogLoaderWorker(path)
-        self.loader.log_loaded.connect(self._insert_log_row)
+        self.loader = LogLoaderWorker(path, self.log_model.format_rows)
+        self.loader.logs_loaded.connect(self._insert_log_rows)
         self.loader.finished.connect(self._on_log_loaded)
         self.loader.error.connect(self._on_error)
         self.loader.start()
 
-    def _insert_log_row(self, entry: dict):
-        self.parsed_logs.append(entry)
+    def _retire(self, worker):
+        """
+        Ask a superseded worker to stop; its queued signals are ignored.
+        """
+        self._retired = [w for w in self._retired if not w.isFinished()]
 
-        row = self.log_table.rowCount()
-        self.log_table.insertRow(row)
+        if worker is not None and not worker.isFinished():
+            worker.requestInterruption()
+            self._retired.append(worker)
 
-        for col, key in enumerate(
-            ("time", "ip", "status", "normalized_request")
-        ):
-            self.log_table.setItem(
-                row, col,
-                QTableWidgetItem(str(entry.get(key, "")))
-            )
+    def _insert_log_rows(self, entries: list, rows: list):
+        if self.sender() is not self.loader:
+            return  # Late batch from a superseded load
+
+        self.parsed_logs.extend(entries)
+        self.log_model.append_formatted(rows)
 
     def _on_log_loaded(self, count: int):
+        if self.sender() is not self.loader:
+            return
+
+        self._load_done.set()
+
+        if self._detecting:
+            return  # Detection (already streaming) reports when done
+
         self.progress.setVisible(False)
-        self.status_label.setText(f"✔ Loaded {count} log entries")
+
+        text = f"✔ Loaded {count} log entries"
+        shown = self.log_model.rowCount()
+        if shown < count:
+            text += f" (showing last {shown:,})"
+        self.status_label.setText(text)
 
     # ================= DETECTION =================
 
     def run_detection(self):
-        if not self.parsed_logs:
+        """
+        Detect over loaded entries; if a file is still loading,
+        detection starts now and follows the load as it progresses.
+        """
+        if not self.parsed_logs and self._load_done.is_set():
             QMessageBox.warning(self, "No Data", "Load a log file first.")
             return
 
-        # 🔒 RESET PDF FLAG (CRITICAL FIX)
-        self.responder._pdf_generated_for_run = False
+        # 🔒 New run → one fresh PDF (CRITICAL FIX)
+        self.responder.start_new_run()
 
-        self.alert_table.setRowCount(0)
+        self.alert_model.clear()
         self.run_btn.setEnabled(False)
+        self._detecting = True
 
         self.status_label.setText("🔍 Running SOC detection engine…")
         self.progress.setVisible(True)
@@ -254,43 +400,25 @@ class LogViewer(QWidget):
         self.detector = DetectionWorker(
             self.parsed_logs,
             self.engine,
-            self.responder
+            self.responder,
+            self._load_done,
+            parallel=self._large_file
         )
-        self.detector.detection_found.connect(self._insert_alert)
+        self.detector.detections_found.connect(self._insert_alerts)
         self.detector.finished.connect(self._on_detection_complete)
         self.detector.start()
 
-    def _insert_alert(self, d: dict):
-        row = self.alert_table.rowCount()
-        self.alert_table.insertRow(row)
-
-        values = [
-            d.get("severity"),
-            d.get("rule"),
-            d.get("ip"),
-            d.get("time"),
-            "IOC" if d.get("ioc_hit") else "",
-        ]
-
-        severity_colors = {
-            "Critical": QColor("#7f1d1d"),
-            "High": QColor("#b45309"),
-            "Medium": QColor("#1e40af"),
-            "Low": QColor("#166534"),
-        }
-
-        for col, val in enumerate(values):
-            item = QTableWidgetItem(str(val))
-            item.setTextAlignment(Qt.AlignCenter)
+    def _insert_alerts(self, detections: list):
+        if self.sender() is not self.detector:
+            return  # Cancelled run
 
-            # 🎯 Color ONLY severity column
-            if col == 0 and val in severity_colors:
-                item.setForeground(Qt.white)
-                item.setBackground(severity_colors[val])
-
-            self.alert_table.setItem(row, col, item)
+        self.alert_model.append_rows(detections)
 
     def _on_detection_complete(self, detections: list):
+        if self.sender() is not self.detector:
+            return
+
+        self._detecting = False
         self.progress.setVisible(False)
         self.run_btn.setEnabled(True)
 
@@ -303,6 +431,31 @@ class LogViewer(QWidget):
         # 🔔 Analytics update
         self.analytics_ready.emit(detections)
 
+    # ================= RESET =================
+
+    def reset(self):
+        """
+        Drop loaded logs and results (dashboard reused after logout).
+
+        Running workers are cancelled; anything they still emit is
+        ignored, so no results reach the next session.
+        """
+        self._retire(self.loader)
+        self._retire(self.detector)
+        self.loader = None
+        self.detector = None
+        self._detecting = False
+
+        self._load_done.set()
+        self.parsed_logs = []
+        self._large_file = False
+        self.log_model.clear()
+        self.alert_model.clear()
+
+        self.progress.setVisible(False)
+        self.run_btn.setEnabled(True)
+        self.status_label.setText("Idle — load logs to begin SOC analysis")
+
     # ================= PDF =================
 
     def open_latest_pdf(self):
@@ -322,6 +475,10 @@ class LogViewer(QWidget):
     # ================= ERROR =================
 
     def _on_error(self, msg: str):
+        if self.sender() is not self.loader:
+            return
+
+        self._load_done.set()
         self.progress.setVisible(False)
         self.run_btn.setEnabled(True)
         QMessageBox.critical(self, "Error", msg)
@@ -18,15 +18,20 @@ from PySide6.QtWidgets import QWidget, QMessageBox
 from PySide6.QtCore import QTimer
 
 
+# Resource root for both:
+# - normal Python execution
+# - PyInstaller EXE (_MEIPASS)
+_BASE_DIR = (
+    Path(sys._MEIPASS) if hasattr(sys, "_MEIPASS")
+    else Path(__file__).resolve().parents[2]
+)
+
+
 def resource_path(relative: str) -> Path:
     """
-    Resolve resource path for both:
-    - normal Python execution
-    - PyInstaller EXE (_MEIPASS)
+    Resolve a bundled resource path.
     """
-    if hasattr(sys, "_MEIPASS"):
-        return Path(sys._MEIPASS) / relative
-    return Path(__file__).resolve().parents[2] / relative
+    return _BASE_DIR / relative
 
 
 class ProjectInfoView(QWidget):
@@ -39,6 +44,11 @@ class ProjectInfoView(QWidget):
         super().__init__(parent)
         self._html_path = resource_path("assets/project_info.html")
 
+        # Bundled asset → checked once; None when missing
+        self._uri = (
+            self._html_path.as_uri() if self._html_path.exists() else None
+        )
+
     # ==================================================
     # NAVIGATION LIFECYCLE
     # ==================================================
@@ -54,7 +64,7 @@ class ProjectInfoView(QWidget):
     # ==================================================
 
     def _open_in_browser(self):
-        if not self._html_path.exists():
+        if self._uri is None:
             QMessageBox.critical(
                 self,
                 "Project Info Not Found",
@@ -64,7 +74,7 @@ class ProjectInfoView(QWidget):
             return
 
         # 🔥 Open in default browser
-        webbrowser.open(self._html_path.as_uri())
+        webbrowser.open(self._uri)
 
         # Immediately return to dashboard
         self._go_back()
@@ -5,6 +5,7 @@ Secure user registration screen for Log SOC Platform.
 
 • First-time & normal registration
 • Cancel / Back to Login
+• Non-blocking (QThread)
 • SOC-grade UX
 """
 
@@ -12,12 +13,50 @@ from PySide6.QtWidgets import (
     QWidget, QLabel, QLineEdit, QPushButton,
     QVBoxLayout, QHBoxLayout, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QFont
 
 from auth.auth_manager import AuthManager
 
 
+# ==================================================
+# WORKER THREAD
+# ==================================================
+
+class RegisterWorker(QThread):
+    """
+    Runs registration (scrypt hashing + DB write) off the UI thread.
+    """
+
+    finished = Signal(dict)
+
+    def __init__(self, auth: AuthManager, username: str, email: str, password: str):
+        super().__init__()
+        self.auth = auth
+        self.username = username
+        self.email = email
+        self.password = password
+
+    def run(self):
+        try:
+            result = self.auth.register_user(
+                self.username,
+                self.email,
+                self.password
+            )
+        except Exception:
+            result = {
+                "success": False,
+                "error": "Unable to register user."
+            }
+
+        self.finished.emit(result)
+
+
+# ==================================================
+# REGISTER VIEW
+# ==================================================
+
 class RegisterView(QWidget):
     """
     User registration screen.
@@ -30,6 +69,7 @@ class RegisterView(QWidget):
         super().__init__()
 
         self.auth = AuthManager()
+        self.worker = None
         self._first_time = False
 
         self.setWindowTitle("Log SOC Platform — User Registration")
@@ -78,7 +118,7 @@ class RegisterView(QWidget):
         self.confirm_input.setEchoMode(QLineEdit.Password)
 
         # ---------- BUTTONS ----------
-        register_btn = QPushButton("Register")
+        self.register_btn = register_btn = QPushButton("Register")
         register_btn.setFixedHeight(36)
         register_btn.setStyleSheet(
             """
@@ -134,7 +174,19 @@ class RegisterView(QWidget):
             QMessageBox.warning(self, "Password Error", "Passwords do not match.")
             return
 
-        result = self.auth.register_user(username, email, password)
+        if self.worker and self.worker.isRunning():
+            return
+
+        self.register_btn.setEnabled(False)
+        self.register_btn.setText("Registering...")
+
+        self.worker = RegisterWorker(self.auth, username, email, password)
+        self.worker.finished.connect(self._on_register_complete)
+        self.worker.start()
+
+    def _on_register_complete(self, result: dict):
+        self.register_btn.setEnabled(True)
+        self.register_btn.setText("Register")
 
         if result.get("success"):
             QMessageBox.information(
@@ -11,45 +11,24 @@ EXE-safe
 SOC-grade UX
 """
 
-import re
+import string
 from PySide6.QtWidgets import (
     QDialog, QLabel, QLineEdit, QPushButton,
     QVBoxLayout, QFormLayout, QMessageBox
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
 
 from auth.password_reset import PasswordResetService
+from frontend.utils.threading import ThreadManager
 
 
-# ==================================================
-# WORKER THREAD
-# ==================================================
-
-class ResetPasswordWorker(QThread):
-    finished = Signal(dict)
-
-    def __init__(self, username: str, token: str, password: str):
-        super().__init__()
-        self.username = username
-        self.token = token
-        self.password = password
-        self.service = PasswordResetService()
+# Password strength classes (set scans run in C, no regex engine)
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_SYMBOLS = frozenset("!@#$%^&*()_+-=[]{};':\"\\|,.<>/?")
 
-    def run(self):
-        try:
-            result = self.service.reset_password(
-                username=self.username,
-                token=self.token,
-                new_password=self.password
-            )
-        except Exception as exc:
-            result = {
-                "success": False,
-                "error": "Password reset failed"
-            }
-
-        self.finished.emit(result)
+PASSWORD_HINT = "Password must include upper, lower, number & symbol (min 8 chars)"
 
 
 # ==================================================
@@ -65,7 +44,10 @@ class ResetPasswordView(QDialog):
         super().__init__(parent)
 
         self.prefill_token = token
-        self.worker = None
+
+        # Resets run as pooled tasks (no OS thread spawned per click)
+        self.service = PasswordResetService()
+        self._threads = ThreadManager(max_threads=1)
 
         self.setWindowTitle("Log SOC Platform — Reset Password")
         self.setFixedSize(440, 360)
@@ -114,15 +96,21 @@ class ResetPasswordView(QDialog):
 
         layout.addLayout(form)
 
-        hint = QLabel(
-            "Password must include upper, lower, number & symbol (min 8 chars)"
-        )
-        hint.setStyleSheet("color: gray; font-size: 10px;")
-        hint.setAlignment(Qt.AlignCenter)
+        self.hint_label = QLabel(PASSWORD_HINT)
+        self.hint_label.setStyleSheet("color: gray; font-size: 10px;")
+        self.hint_label.setAlignment(Qt.AlignCenter)
 
-        layout.addWidget(hint)
+        layout.addWidget(self.hint_label)
         layout.addSpacing(12)
 
+        # Live strength hint: keystrokes restart the timer, so the
+        # check runs once typing pauses (not once per key)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self._update_strength_hint)
+        self.password_input.textChanged.connect(self._debounce.start)
+
         self.submit_btn = QPushButton("Reset Password")
         self.submit_btn.setFixedHeight(36)
         self.submit_btn.setStyleSheet(
@@ -147,13 +135,26 @@ class ResetPasswordView(QDialog):
     # ==================================================
 
     def _password_strong(self, password: str) -> bool:
-        return all([
-            len(password) >= 8,
-            re.search(r"[A-Z]", password),
-            re.search(r"[a-z]", password),
-            re.search(r"\d", password),
-            re.search(r"[!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>/?]", password),
-        ])
+        return (
+            len(password) >= 8
+            and not _UPPER.isdisjoint(password)
+            and not _LOWER.isdisjoint(password)
+            and any(map(str.isdecimal, password))  # Same set as regex \d
+            and not _SYMBOLS.isdisjoint(password)
+        )
+
+    def _update_strength_hint(self):
+        password = self.password_input.text()
+
+        if not password:
+            text, color = PASSWORD_HINT, "gray"
+        elif self._password_strong(password):
+            text, color = "✔ Password meets requirements", "#16a34a"
+        else:
+            text, color = PASSWORD_HINT, "#d97706"
+
+        self.hint_label.setText(text)
+        self.hint_label.setStyleSheet(f"color: {color}; font-size: 10px;")
 
     # ==================================================
     # HANDLER
@@ -188,9 +189,17 @@ class ResetPasswordView(QDialog):
         self.submit_btn.setEnabled(False)
         self.submit_btn.setText("Updating...")
 
-        self.worker = ResetPasswordWorker(username, token, password)
-        self.worker.finished.connect(self._on_reset_complete)
-        self.worker.start()
+        self._threads.run(
+            self.service.reset_password,
+            kwargs={
+                "username": username,
+                "token": token,
+                "new_password": password
+            },
+            on_result=self._on_reset_complete,
+            on_error=self._on_reset_error,
+            thread_name="password-reset"
+        )
 
     # ==================================================
     # CALLBACK
@@ -213,3 +222,9 @@ class ResetPasswordView(QDialog):
                 "Reset Failed",
                 result.get("error", "Password reset failed")
             )
+
+    def _on_reset_error(self, message: str):
+        self._on_reset_complete({
+            "success": False,
+            "error": "Password reset failed"
+        })
@@ -14,12 +14,13 @@ SOC-grade:
 from PySide6.QtWidgets import (
     QWidget, QLabel, QPushButton,
     QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem
+    QTableView
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 from core.rules import DETECTION_RULES
+from frontend.widgets.tables import RecordTableModel
 
 
 class RulesViewer(QWidget):
@@ -69,16 +70,16 @@ class RulesViewer(QWidget):
         header_layout.addWidget(close_btn)
 
         # -------- TABLE --------
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels([
-            "RULE NAME",
-            "REGEX / INDICATOR"
+        self.model = RecordTableModel([
+            ("RULE NAME", lambda rule: rule[0]),
+            ("REGEX / INDICATOR", lambda rule: rule[1]),
         ])
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
         self.table.verticalHeader().setVisible(False)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setAlternatingRowColors(True)
@@ -99,17 +100,6 @@ class RulesViewer(QWidget):
     # ==================================================
 
     def _load_rules(self):
-        self.table.setRowCount(len(DETECTION_RULES))
-
-        for row, (rule, pattern) in enumerate(DETECTION_RULES.items()):
-            self._set_item(row, 0, rule)
-            self._set_item(row, 1, pattern)
-
-    # ==================================================
-    # HELPERS
-    # ==================================================
-
-    def _set_item(self, row: int, col: int, text: str):
-        item = QTableWidgetItem(str(text))
-        item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        self.table.setItem(row, col, item)
+        # (name, pattern) str pairs are already display rows → no
+        # getter / str() pass; default alignment is left / v-center
+        self.model.append_formatted(list(DETECTION_RULES.items()))
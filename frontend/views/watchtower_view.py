@@ -11,13 +11,16 @@ SOC-grade:
 - EXE-safe
 """
 
+from collections import OrderedDict
+
 from PySide6.QtWidgets import (
     QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem
+    QTableView
 )
-from PySide6.QtCore import Qt, Signal, QThread
+from PySide6.QtCore import Signal, QThread, QTimer
 
 from monitoring.process_monitor import ProcessMonitor
+from frontend.widgets.tables import RingTableModel
 
 
 # ==================================================
@@ -57,11 +60,25 @@ class WatchtowerView(QWidget):
     Real-time host monitoring panel.
     """
 
+    # Newest-first event rows kept (ring buffer)
+    MAX_ROWS = 5000
+
+    # (type, pid) pairs remembered for dedup (least recent evicted)
+    DEDUP_CACHE_SIZE = 4096
+
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
 
         self.worker: WatchtowerWorker | None = None
-        self._last_event_cache: dict[tuple, str] = {}
+        self._last_event_cache: OrderedDict[tuple, str] = OrderedDict()
+
+        # Event bursts are coalesced: rows queue here and reach the
+        # model in one insert per flush (one repaint, not one per cell)
+        self._pending: list[tuple] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
 
         self._build_ui()
 
@@ -89,13 +106,22 @@ class WatchtowerView(QWidget):
         controls.addStretch()
 
         # -------- TABLE --------
-        self.table = QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels(
-            ["TYPE", "PID", "PROCESS", "DETAILS"]
+        # Rows arrive pre-formatted as (type, pid, process, details)
+        self.model = RingTableModel(
+            [
+                ("TYPE", lambda row: row[0]),
+                ("PID", lambda row: row[1]),
+                ("PROCESS", lambda row: row[2]),
+                ("DETAILS", lambda row: row[3]),
+            ],
+            capacity=self.MAX_ROWS,
+            centered=True
         )
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         self.table.setAlternatingRowColors(True)
         self.table.verticalHeader().setVisible(False)
 
@@ -143,6 +169,16 @@ class WatchtowerView(QWidget):
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
 
+    def reset(self):
+        """
+        Stop monitoring and clear events (dashboard reused after logout).
+        """
+        self.stop_monitoring()
+        self._flush_timer.stop()
+        self._pending.clear()
+        self._last_event_cache.clear()
+        self.model.clear()
+
     # ==================================================
     # EVENT HANDLING
     # ==================================================
@@ -159,19 +195,29 @@ class WatchtowerView(QWidget):
         if event_type == "High Memory Usage":
             details = f'{event.get("memory_mb", "")} MB'
 
-        # Deduplication (SOC-safe)
+        # Deduplication (SOC-safe, bounded LRU)
         key = (event_type, pid)
-        if self._last_event_cache.get(key) == details:
+        cache = self._last_event_cache
+        if cache.get(key) == details:
+            cache.move_to_end(key)
             return
 
-        self._last_event_cache[key] = details
+        cache[key] = details
+        cache.move_to_end(key)
+        if len(cache) > self.DEDUP_CACHE_SIZE:
+            cache.popitem(last=False)
+
         self._insert_row(event_type, pid, process, details)
 
     def _insert_row(self, event_type, pid, process, details):
-        self.table.insertRow(0)
-
-        values = [event_type, pid, process, details]
-        for col, value in enumerate(values):
-            item = QTableWidgetItem(str(value))
-            item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(0, col, item)
+        self._pending.append(
+            (str(event_type), str(pid), str(process), str(details))
+        )
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        pending, self._pending = self._pending, []
+        if pending:
+            # Newest event on top
+            self.model.push_formatted(pending)
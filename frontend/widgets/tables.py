@@ -9,17 +9,20 @@ Features:
 • Read-only by default
 • Scroll-safe
 • PySide6 native
+• Item-free model for large / live tables
 
 UI ONLY
 """
 
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
 from PySide6.QtWidgets import (
     QTableWidget,
     QTableWidgetItem,
     QHeaderView,
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush, QColor, QFont
 
 
 # ==================================================
@@ -35,6 +38,7 @@ SEVERITY_COLORS = {
 
 IOC_COLOR = QColor("#5b21b6")        # purple
 DEFAULT_TEXT = QColor("#e5e7eb")
+WHITE_TEXT = QColor("white")
 
 
 # ==================================================
@@ -62,6 +66,16 @@ class SOCTable(QTableWidget):
         header.setStretchLastSection(True)
         header.setSectionResizeMode(QHeaderView.Interactive)
 
+        # Prototype cells: clone() copies alignment / colors / font in
+        # one call instead of a setter per attribute per cell
+        self._cell_proto = QTableWidgetItem()
+        self._cell_proto.setTextAlignment(Qt.AlignCenter)
+
+        self._text_proto = self._cell_proto.clone()
+        self._text_proto.setForeground(DEFAULT_TEXT)
+
+        self._bold_font = QFont("Segoe UI", 9, QFont.Bold)
+
         self._apply_style()
 
     # --------------------------------------------------
@@ -118,10 +132,10 @@ class SOCTable(QTableWidget):
         row = self.rowCount()
         self.insertRow(row)
 
+        proto = self._text_proto
         for col, value in enumerate(values):
-            item = QTableWidgetItem(str(value))
-            item.setForeground(DEFAULT_TEXT)
-            item.setTextAlignment(Qt.AlignCenter)
+            item = proto.clone()
+            item.setText(str(value))
             self.setItem(row, col, item)
 
 
@@ -152,22 +166,23 @@ class AlertTable(SOCTable):
             "IOC" if ioc_hit else "",
         ]
 
+        proto = self._cell_proto
         for col, value in enumerate(values):
-            item = QTableWidgetItem(str(value))
-            item.setTextAlignment(Qt.AlignCenter)
+            item = proto.clone()
+            item.setText(str(value))
 
             # Severity coloring
             if col == 0:
                 color = SEVERITY_COLORS.get(severity)
                 if color:
                     item.setBackground(color)
-                    item.setForeground(QColor("white"))
-                    item.setFont(QFont("Segoe UI", 9, QFont.Bold))
+                    item.setForeground(WHITE_TEXT)
+                    item.setFont(self._bold_font)
 
             # IOC highlight
             if ioc_hit and col == 4:
                 item.setForeground(IOC_COLOR)
-                item.setFont(QFont("Segoe UI", 9, QFont.Bold))
+                item.setFont(self._bold_font)
 
             self.setItem(row, col, item)
 
@@ -200,3 +215,238 @@ class LogTable(SOCTable):
         # Prevent memory bloat
         if self.rowCount() > 1000:
             self.removeRow(0)
+
+
+# ==================================================
+# RECORD MODELS (QTableView)
+# ==================================================
+
+# Column = (header, dict key or record → value callable)
+Column = Tuple[str, Union[str, Callable[[dict], Any]]]
+
+
+class _RecordModel(QAbstractTableModel):
+    """
+    Read-only model over dict records, formatted to str on insert.
+
+    Subclasses own the storage (rowCount / _cell).
+    """
+
+    def __init__(
+        self,
+        columns: List[Column],
+        centered: bool = False,
+        severity_colors: Optional[Dict[str, QColor]] = None,
+        parent=None
+    ):
+        super().__init__(parent)
+
+        self._headers = [header for header, _ in columns]
+        self._getters = [
+            (lambda record, key=key: record.get(key, ""))
+            if isinstance(key, str) else key
+            for _, key in columns
+        ]
+
+        self._alignment = Qt.AlignCenter if centered else None
+
+        # Column 0 holds the severity → colored cell (white text).
+        # Brushes built once: data() hands the same objects to every cell.
+        self._severity_bg = {
+            severity: QBrush(color)
+            for severity, color in (severity_colors or {}).items()
+        }
+        self._severity_fg = QBrush(WHITE_TEXT)
+
+    def _cell(self, row: int, col: int) -> str:
+        raise NotImplementedError
+
+    def format_row(self, record: dict) -> Tuple[str, ...]:
+        """
+        Display strings for one record.
+
+        Pure (no model state touched) → workers may call it so the
+        str() work happens off the GUI thread.
+        """
+        return tuple(str(getter(record)) for getter in self._getters)
+
+    def format_rows(self, records: Iterable[dict]) -> List[Tuple[str, ...]]:
+        return [self.format_row(record) for record in records]
+
+    # --------------------------------------------------
+    # QAbstractTableModel
+    # --------------------------------------------------
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            return self._cell(index.row(), col)
+
+        if role == Qt.TextAlignmentRole:
+            return self._alignment
+
+        if col == 0 and self._severity_bg:
+            if role == Qt.BackgroundRole:
+                return self._severity_bg.get(self._cell(index.row(), 0))
+            if role == Qt.ForegroundRole:
+                if self._cell(index.row(), 0) in self._severity_bg:
+                    return self._severity_fg
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+
+class RecordTableModel(_RecordModel):
+    """
+    Append-only record model (e.g. a loaded log file).
+
+    Cells are stored column-wise (one list per column) — no
+    QTableWidgetItem per cell. With `max_rows` only the newest rows
+    are kept (oldest dropped from the top).
+    """
+
+    def __init__(
+        self,
+        columns: List[Column],
+        max_rows: Optional[int] = None,
+        **kwargs
+    ):
+        super().__init__(columns, **kwargs)
+        self._cols: List[List[str]] = [[] for _ in columns]
+        self._max_rows = max_rows
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cols[0])
+
+    def _cell(self, row: int, col: int) -> str:
+        return self._cols[col][row]
+
+    def append_rows(self, records: Iterable[dict]):
+        """
+        Append records at the bottom (one insert notification).
+        """
+        self.append_formatted(self.format_rows(records))
+
+    def append_formatted(self, rows: List[Tuple[str, ...]]):
+        """
+        append_rows() for rows already built by format_rows().
+        """
+        if not rows:
+            return
+
+        cap = self._max_rows
+        if cap is not None:
+            rows = rows[-cap:]
+
+            # Oldest rows make room first (one remove notification)
+            overflow = self.rowCount() + len(rows) - cap
+            if overflow > 0:
+                self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+                for column in self._cols:
+                    del column[:overflow]
+                self.endRemoveRows()
+
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for column, values in zip(self._cols, zip(*rows)):
+            column.extend(values)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        for column in self._cols:
+            column.clear()
+        self.endResetModel()
+
+
+class RingTableModel(_RecordModel):
+    """
+    Newest-first record model over a fixed-capacity ring buffer.
+
+    Row 0 is the latest record; once full, each insert overwrites the
+    oldest slot in O(1) (no list shifting, no reallocation).
+    """
+
+    def __init__(self, columns: List[Column], capacity: int, **kwargs):
+        super().__init__(columns, **kwargs)
+
+        self._capacity = capacity
+        self._buf: List[Optional[Tuple[str, ...]]] = [None] * capacity
+        self._head = 0  # Next slot to write
+        self._size = 0
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._size
+
+    def _cell(self, row: int, col: int) -> str:
+        return self._buf[(self._head - 1 - row) % self._capacity][col]
+
+    def push(self, record: dict):
+        """
+        Add a record on top, evicting the oldest when full.
+        """
+        self.push_many((record,))
+
+    def push_many(self, records: Iterable[dict]):
+        """
+        Add records (oldest first) on top in one insert notification.
+
+        Rows pushed out of the buffer are removed first, in one
+        notification, from the bottom.
+        """
+        records = list(records)[-self._capacity:]
+        self.push_formatted(self.format_rows(records))
+
+    def push_formatted(self, rows: List[Tuple[str, ...]]):
+        """
+        push_many() for rows already built by format_rows().
+        """
+        rows = rows[-self._capacity:]
+        count = len(rows)
+        if not count:
+            return
+
+        # A batch filling the whole buffer replaces every visible row:
+        # one reset beats a full-table remove + insert
+        if count == self._capacity:
+            self.beginResetModel()
+            self._write(rows)
+            self._size = count
+            self.endResetModel()
+            return
+
+        # Oldest rows (the bottom ones) own the slots about to be reused
+        overflow = self._size + count - self._capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), self._size - overflow, self._size - 1)
+            self._size -= overflow
+            self.endRemoveRows()
+
+        self.beginInsertRows(QModelIndex(), 0, count - 1)
+        self._write(rows)
+        self._size += count
+        self.endInsertRows()
+
+    def _write(self, rows: List[Tuple[str, ...]]):
+        # Only the head moves; existing rows are never shifted
+        for row in rows:
+            self._buf[self._head] = row
+            self._head = (self._head + 1) % self._capacity
+
+    def clear(self):
+        self.beginResetModel()
+        self._buf = [None] * self._capacity
+        self._head = 0
+        self._size = 0
+        self.endResetModel()
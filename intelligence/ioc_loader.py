@@ -12,6 +12,7 @@ SOC-grade, offline-first IOC engine.
 import json
 import time
 import logging
+import threading
 from pathlib import Path
 from typing import Set, Optional
 
@@ -150,10 +151,23 @@ class IOCEngine:
 # ==================================================
 
 _ioc_engine: Optional[IOCEngine] = None
+_ioc_lock = threading.Lock()
 
 
 def get_ioc_engine() -> IOCEngine:
+    """
+    Process-wide IOC engine (feeds loaded exactly once).
+
+    Views, workers and the scheduler may race on first use —
+    the lock keeps it to a single cache read / feed download.
+    """
     global _ioc_engine
-    if _ioc_engine is None:
-        _ioc_engine = IOCEngine()
-    return _ioc_engine
+
+    engine = _ioc_engine
+    if engine is not None:
+        return engine
+
+    with _ioc_lock:
+        if _ioc_engine is None:
+            _ioc_engine = IOCEngine()
+        return _ioc_engine
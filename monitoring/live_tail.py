@@ -19,6 +19,10 @@ from typing import Callable
 class LiveLogTailer:
     """
     Real-time log file tailer.
+
+    poll() reads whatever was appended since the previous call, so the
+    tailer can be driven by file-change notifications (see
+    LiveTailWorker) or by the blocking polling loop in start().
     """
 
     def __init__(
@@ -34,8 +38,9 @@ class LiveLogTailer:
         self.logger = logging.getLogger("SOC.LiveTailer")
 
         self._file = None
-        self._last_inode = None
-        self._last_size = 0
+        self._inode = None
+        self._pos = 0
+        self._partial = b""  # Trailing bytes of a line still being written
 
     # ==================================================
     # CONTROL
@@ -43,22 +48,14 @@ class LiveLogTailer:
 
     def start(self):
         """
-        Start tailing the log file.
+        Start tailing the log file (blocking polling loop).
         """
         self._running = True
         self.logger.info("Started live log tailing: %s", self.file_path)
 
         while self._running:
             try:
-                self._open_if_needed()
-
-                line = self._file.readline()
-                if line:
-                    try:
-                        self.callback(line.rstrip("\n"))
-                    except Exception as exc:
-                        self.logger.error("Callback failed: %s", exc)
-                else:
+                if not self.poll():
                     time.sleep(self.poll_interval)
 
             except FileNotFoundError:
@@ -74,8 +71,7 @@ class LiveLogTailer:
                 self._close_file()
                 time.sleep(1)
 
-        self._close_file()
-        self.logger.info("Stopped live log tailing")
+        self.close()
 
     def stop(self):
         """
@@ -83,29 +79,64 @@ class LiveLogTailer:
         """
         self._running = False
 
+    def close(self):
+        self._close_file()
+        self.logger.info("Stopped live log tailing")
+
+    # ==================================================
+    # INCREMENTAL READ
+    # ==================================================
+
+    def poll(self) -> int:
+        """
+        Deliver complete lines appended since the last call.
+
+        Returns the number of lines passed to the callback.
+        Raises FileNotFoundError while the file is missing.
+        """
+        self._open_if_needed()
+
+        data = self._file.read()
+        if not data:
+            return 0
+
+        self._pos += len(data)
+
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+
+        for line in lines:
+            try:
+                self.callback(line.decode("utf-8", "ignore").rstrip("\r"))
+            except Exception as exc:
+                self.logger.error("Callback failed: %s", exc)
+
+        return len(lines)
+
     # ==================================================
     # INTERNAL
     # ==================================================
 
     def _open_if_needed(self):
         """
-        Open file or reopen if rotated.
+        Open file or reopen if rotated / truncated.
         """
         stat = os.stat(self.file_path)
-        inode = (stat.st_ino, stat.st_size)
 
-        # File opened first time or rotated
-        if self._file is None or inode != self._last_inode:
+        if self._file is None:
+            # First open → tail semantics (existing content skipped)
+            self._open(stat, os.SEEK_END)
+
+        elif stat.st_ino != self._inode or stat.st_size < self._pos:
+            # Rotated or truncated → the new content starts at 0
             self._close_file()
-            self._file = open(
-                self.file_path,
-                "r",
-                encoding="utf-8",
-                errors="ignore"
-            )
-            self._file.seek(0, os.SEEK_END)
-            self._last_inode = inode
-            self._last_size = stat.st_size
+            self._open(stat, os.SEEK_SET)
+
+    def _open(self, stat, whence: int):
+        self._file = open(self.file_path, "rb")
+        self._pos = self._file.seek(0, whence)
+        self._inode = stat.st_ino
+        self._partial = b""
 
     def _close_file(self):
         """
@@ -117,5 +148,6 @@ class LiveLogTailer:
             except Exception:
                 pass
             self._file = None
-            self._last_inode = None
-            self._last_size = 0
+            self._inode = None
+            self._pos = 0
+            self._partial = b""
@@ -52,47 +52,75 @@ class ResponseEngine(QObject):
         self._pdf_generated_for_run = False
 
     # ==================================================
-    # PUBLIC ENTRY POINT
+    # PUBLIC ENTRY POINTS
     # ==================================================
 
+    def start_new_run(self):
+        """
+        Begin a new detection run (re-arms the one-PDF-per-run report).
+        """
+        self._pdf_generated_for_run = False
+
     def handle_detection(self, detection: dict):
-        if not detection:
-            return
+        if detection:
+            self.handle_bulk_detections([detection])
+
+    def handle_bulk_detections(self, detections: list):
+        """
+        Respond to a batch of detections.
 
-        severity = detection.get("severity", "Low")
-        ip = detection.get("ip", "UNKNOWN")
-        rule = detection.get("rule", "Unknown Threat")
-        ioc_hit = bool(detection.get("ioc_hit", False))
+        Firewall per incident, ONE email and ONE PDF for the batch.
+        """
+        if not detections:
+            return
 
-        incident_key = (ip, rule, severity)
         now = datetime.utcnow()
 
         # =========================
         # 🔒 DEDUPLICATION
         # =========================
+        new_detections = []
         with self._lock:
             self._cleanup_old_incidents(now)
 
-            if incident_key in self._handled_incidents:
-                return
+            for detection in detections:
+                incident_key = (
+                    detection.get("ip", "UNKNOWN"),
+                    detection.get("rule", "Unknown Threat"),
+                    detection.get("severity", "Low")
+                )
+                if incident_key in self._handled_incidents:
+                    continue
+
+                self._handled_incidents[incident_key] = now
+                new_detections.append(detection)
 
-            self._handled_incidents[incident_key] = now
+        if not new_detections:
+            return
 
         # =========================
         # 1️⃣ FIREWALL RESPONSE
         # =========================
-        try:
-            blocked = self._handle_firewall(severity, ip, rule, ioc_hit)
-            if blocked:
-                self.ip_blocked.emit()
-        except Exception as exc:
-            self.logger.error("Firewall response failed: %s", exc)
+        blocked = False
+        for detection in new_detections:
+            try:
+                blocked |= self._handle_firewall(
+                    detection.get("severity", "Low"),
+                    detection.get("ip", "UNKNOWN"),
+                    detection.get("rule", "Unknown Threat"),
+                    bool(detection.get("ioc_hit", False))
+                )
+            except Exception as exc:
+                self.logger.error("Firewall response failed: %s", exc)
+
+        if blocked:
+            self.ip_blocked.emit()
 
         # =========================
-        # 2️⃣ EMAIL ALERT
+        # 2️⃣ EMAIL ALERT (ONE PER BATCH)
         # =========================
         try:
-            self._handle_email(severity, detection)
+            self._handle_email(new_detections)
         except Exception as exc:
             self.logger.error("Email alert failed: %s", exc)
 
@@ -101,7 +129,7 @@ class ResponseEngine(QObject):
         # =========================
         if not self._pdf_generated_for_run:
             try:
-                report_path = self.reporter.generate(detection)
+                report_path = self.reporter.generate_batch(new_detections)
                 self._pdf_generated_for_run = True
                 self.logger.info(
                     "📄 Incident report generated → %s",
@@ -139,14 +167,18 @@ class ResponseEngine(QObject):
 
         return False
 
-    def _handle_email(self, severity: str, detection: dict):
+    def _handle_email(self, detections: list):
         if not FEATURES.get("EMAIL_ALERTS", False):
             return
 
-        if FEATURES.get("EMAIL_ALL_DETECTIONS", False):
-            self.alerter.send_alert(detection)
-        elif severity in ("High", "Critical"):
-            self.alerter.send_alert(detection)
+        if not FEATURES.get("EMAIL_ALL_DETECTIONS", False):
+            detections = [
+                d for d in detections
+                if d.get("severity", "Low") in ("High", "Critical")
+            ]
+
+        if detections:
+            self.alerter.send_batch_alerts(detections)
 
     # ==================================================
     # HOUSEKEEPING
@@ -0,0 +1,84 @@
+"""
+Detection backends must agree with stdlib re (the reference semantics),
+whichever optional regex packages are installed.
+"""
+
+import re
+import unittest
+from unittest import mock
+
+import core.detector as detector
+from core.rules import DETECTION_RULES
+
+
+REFERENCE = {
+    name: re.compile(pattern, re.IGNORECASE)
+    for name, pattern in DETECTION_RULES.items()
+}
+
+PAYLOADS = [
+    # Unicode case folding (evasion)
+    "unıon select 1",
+    "1 union ſelect password from users",
+    "/index.php?q=UNİON SELECT 1",
+    "/adminK",
+    # Unicode word characters around \b (false positives)
+    "éwget http://x",
+    "КKeyError",
+    "ßmd5",
+    "user=é password=1",
+    # Whitespace outside [ \t\n\f\r]
+    "union\x0bselect 1",
+    "1 or\x1c1=1",
+    "failed\x1flogin",
+    "failed\xa0login",
+    "pip install x github.com",
+    # Length counted in characters, not bytes
+    "?" + "é" * 300,
+    "?" + "é" * 150,
+    # Plain ASCII sanity
+    "GET /api/users/42 HTTP/1.1",
+    "' or '1'='1",
+    "curl http://169.254.169.254/latest",
+]
+
+
+def _reference(payload):
+    return [name for name, regex in REFERENCE.items() if regex.search(payload)]
+
+
+class BackendEquivalenceTest(unittest.TestCase):
+
+    def _check(self, hyperscan: bool, re2: bool):
+        with mock.patch.object(
+            detector, "HYPERSCAN_AVAILABLE", hyperscan and detector.HYPERSCAN_AVAILABLE
+        ), mock.patch.object(
+            detector, "RE2_AVAILABLE", re2 and detector.RE2_AVAILABLE
+        ):
+            engine = detector.DetectionEngine()
+
+        for payload in PAYLOADS:
+            with self.subTest(payload=payload):
+                self.assertEqual(engine._match_rules(payload), _reference(payload))
+
+    def test_stdlib(self):
+        self._check(hyperscan=False, re2=False)
+
+    @unittest.skipUnless(detector.RE2_AVAILABLE, "google-re2 not installed")
+    def test_re2(self):
+        self._check(hyperscan=False, re2=True)
+
+    @unittest.skipUnless(detector.HYPERSCAN_AVAILABLE, "hyperscan not installed")
+    def test_hyperscan(self):
+        self._check(hyperscan=True, re2=False)
+
+    @unittest.skipUnless(
+        detector.HYPERSCAN_AVAILABLE and detector.RE2_AVAILABLE,
+        "hyperscan and google-re2 not installed"
+    )
+    def test_hyperscan_with_re2(self):
+        self._check(hyperscan=True, re2=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+mmap / bytes parsing must yield exactly what parse_log_line() gives over
+the file opened in text mode (UTF-8, errors ignored, universal newlines).
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from core.parser import parse_log_file, parse_log_line, _line_ranges, _parse_range
+
+
+LINE = b'10.0.0.1 - - [10/Oct/2000:13:55:36 -0700] "GET /a HTTP/1.0" 200 2326'
+
+CASES = {
+    "invalid_after_lone_cr": LINE + b"\r\xff\xfe\n" + LINE + b"\n",
+    "invalid_between_crs": LINE + b"\r\xff\r" + LINE + b"\n",
+    "invalid_at_eof": LINE + b"\n\xff\xfe",
+    "invalid_after_cr_at_eof": LINE + b"\r\xff",
+    "invalid_only_line": LINE + b"\n\xff\n" + LINE,
+    "truncated_multibyte": b"caf\xc3\n\xe2\x82\r\n" + LINE,
+    "blank_lines": b"\n\r\n\r" + LINE + b"\n\n",
+    "unicode_line": "10.0.0.2 user=é ünion\r\n".encode("utf-8") + LINE,
+}
+
+
+def _text_mode(path):
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return [parse_log_line(line) for line in f]
+
+
+class ParseBytesEquivalenceTest(unittest.TestCase):
+
+    def _write(self, data: bytes) -> str:
+        fd, path = tempfile.mkstemp(suffix=".log")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def _check(self, data: bytes):
+        path = self._write(data)
+        expected = _text_mode(path)
+
+        self.assertEqual(list(parse_log_file(path)), expected)
+
+        ranged = []
+        for start, end in _line_ranges(path, 3):
+            ranged.extend(_parse_range(path, start, end, None))
+        self.assertEqual(ranged, expected)
+
+    def test_edge_cases(self):
+        for name, data in CASES.items():
+            with self.subTest(case=name):
+                self._check(data)
+
+    def test_random_bytes(self):
+        rng = random.Random(11)
+        alphabet = [b"\n", b"\r", b"\r\n", b"\xff", b"\xc3", b"\xa9", b" ", b"a", LINE]
+
+        for i in range(300):
+            data = b"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 25)))
+            with self.subTest(i=i, data=data):
+                self._check(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
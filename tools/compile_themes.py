@@ -0,0 +1,50 @@
+"""
+SOC Theme Compiler (Build Step)
+-------------------------------
+Embeds the QSS themes into a Python module before packaging.
+
+✔ Run before PyInstaller
+✔ EXE reads themes from memory (no _MEIPASS file I/O)
+✔ Source runs keep reading the .qss files
+"""
+
+from pathlib import Path
+
+# ================= CONFIG =================
+
+THEMES_DIR = Path(__file__).resolve().parents[1] / "frontend" / "themes"
+OUTPUT_FILE = THEMES_DIR / "_compiled.py"
+
+THEMES = {
+    "DARK_QSS": "dark.qss",
+    "LIGHT_QSS": "light.qss",
+}
+
+# ================= BUILD =================
+
+def compile_themes() -> str:
+    lines = [
+        '"""',
+        "Compiled QSS themes (generated by tools/compile_themes.py).",
+        "DO NOT EDIT — edit the .qss files and re-run the tool.",
+        '"""',
+        "",
+    ]
+
+    for const, filename in THEMES.items():
+        text = (THEMES_DIR / filename).read_text(encoding="utf-8", errors="replace")
+        lines.append(f"{const}: str = {text!r}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def main():
+    OUTPUT_FILE.write_text(compile_themes(), encoding="utf-8")
+
+    print("✅ Themes compiled")
+    print(f"📄 File: {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()